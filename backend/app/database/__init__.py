@@ -1,3 +1,21 @@
-from .mongodb import connect_to_mongo, close_mongo_connection, get_database, mongodb
+from .mongodb import (
+    connect_to_mongo,
+    close_mongo_connection,
+    database_available,
+    database_stats,
+    DatabaseUnavailableError,
+    get_database,
+    get_read_database,
+    mongodb
+)
 
-__all__ = ["connect_to_mongo", "close_mongo_connection", "get_database", "mongodb"]
+__all__ = [
+    "connect_to_mongo",
+    "close_mongo_connection",
+    "database_available",
+    "database_stats",
+    "DatabaseUnavailableError",
+    "get_database",
+    "get_read_database",
+    "mongodb"
+]
@@ -2,18 +2,82 @@
 MongoDB database connection and configuration
 """
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import MongoClient
+from pymongo import MongoClient, ReadPreference
+from pymongo.errors import ConnectionFailure
+import importlib.util
 import os
-from typing import Optional
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
 import logging
+from app.database.monitoring import PoolStatsListener, TopologyStateListener
 
 logger = logging.getLogger(__name__)
 
+# Wire compressor -> module it needs (zlib is built in)
+COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": None}
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST
+}
+
 class MongoDB:
     client: Optional[AsyncIOMotorClient] = None
     db = None
+    # Same database with the read preference for listing and matching queries
+    read_db = None
+    options: Dict[str, Any] = {}
 
 mongodb = MongoDB()
+pool_stats = PoolStatsListener()
+topology_state = TopologyStateListener()
+
+class DatabaseUnavailableError(ConnectionFailure):
+    """Raised without contacting MongoDB while its servers are known to be unreachable"""
+
+def _env_ms(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+def available_compressors(names: List[str]) -> List[str]:
+    """Requested wire compressors whose libraries are installed, in order of preference"""
+    available = []
+    for name in names:
+        if name not in COMPRESSOR_MODULES:
+            logger.warning(f"Unknown MongoDB compressor: {name}")
+        elif COMPRESSOR_MODULES[name] and importlib.util.find_spec(COMPRESSOR_MODULES[name]) is None:
+            logger.warning(f"MongoDB compressor {name} requires the {COMPRESSOR_MODULES[name]} package; skipping")
+        else:
+            available.append(name)
+    return available
+
+def client_options(mongodb_url: str = "") -> Dict[str, Any]:
+    """MongoClient pool, timeout and compression options from the environment; options set in the URL win"""
+    options = {
+        "maxPoolSize": int(os.getenv("MONGODB_MAX_POOL_SIZE", "100")),
+        "minPoolSize": int(os.getenv("MONGODB_MIN_POOL_SIZE", "0")),
+        "maxIdleTimeMS": _env_ms("MONGODB_MAX_IDLE_TIME_MS"),
+        "waitQueueTimeoutMS": _env_ms("MONGODB_WAIT_QUEUE_TIMEOUT_MS"),
+        "serverSelectionTimeoutMS": int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "30000")),
+        "connectTimeoutMS": int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "20000")),
+        "socketTimeoutMS": _env_ms("MONGODB_SOCKET_TIMEOUT_MS")
+    }
+    compressors = available_compressors(
+        [name.strip() for name in os.getenv("MONGODB_COMPRESSORS", "").split(",") if name.strip()])
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    in_url = {key.lower() for key in parse_qs(urlsplit(mongodb_url).query)}
+    return {key: value for key, value in options.items() if value is not None and key.lower() not in in_url}
+
+def read_preference():
+    """Read preference for listing and matching queries (MONGODB_LIST_READ_PREFERENCE)"""
+    name = os.getenv("MONGODB_LIST_READ_PREFERENCE", "secondaryPreferred")
+    if name not in READ_PREFERENCES:
+        raise ValueError(f"Unknown MongoDB read preference: {name}")
+    return READ_PREFERENCES[name]
 
 async def connect_to_mongo():
     """Connect to MongoDB"""
@@ -21,9 +85,11 @@ async def connect_to_mongo():
     mongodb_name = os.getenv("MONGODB_NAME", "jobeez")
     
     try:
-        logger.info(f"Connecting to MongoDB at {mongodb_url}")
-        mongodb.client = AsyncIOMotorClient(mongodb_url)
+        mongodb.options = client_options(mongodb_url)
+        logger.info(f"Connecting to MongoDB at {mongodb_url} with {mongodb.options}")
+        mongodb.client = AsyncIOMotorClient(mongodb_url, event_listeners=[pool_stats, topology_state], **mongodb.options)
         mongodb.db = mongodb.client[mongodb_name]
+        mongodb.read_db = mongodb.db.with_options(read_preference=read_preference())
         
         # Test connection
         await mongodb.client.admin.command('ping')
@@ -48,20 +114,76 @@ async def create_indexes():
         # Resume indexes
         await mongodb.db.resumes.create_index("id", unique=True)
         await mongodb.db.resumes.create_index("created_at")
+        await mongodb.db.resumes.create_index([("created_at", -1), ("id", -1)])
         await mongodb.db.resumes.create_index([("skills.name", "text"), ("name", "text")])
         
         # Job indexes
         await mongodb.db.jobs.create_index("id", unique=True)
+        await mongodb.db.jobs.create_index("external_id", unique=True, sparse=True)
         await mongodb.db.jobs.create_index("title")
         await mongodb.db.jobs.create_index("company")
         await mongodb.db.jobs.create_index("location")
         await mongodb.db.jobs.create_index("posted_date")
+        # Keyset pagination order
+        await mongodb.db.jobs.create_index([("posted_date", -1), ("id", -1)])
         await mongodb.db.jobs.create_index([("title", "text"), ("description", "text"), ("company", "text")])
         
+        # Prefix search on normalized fields, and combined filters
+        await mongodb.db.jobs.create_index("title_lc")
+        await mongodb.db.jobs.create_index("company_lc")
+        await mongodb.db.jobs.create_index("location_lc")
+        await mongodb.db.jobs.create_index([("remote", 1), ("title_lc", 1), ("company_lc", 1), ("location_lc", 1)])
+        
+        # Job embedding indexes
+        await mongodb.db.job_embeddings.create_index("job_id", unique=True)
+        await mongodb.db.job_embeddings.create_index("updated_at")
+        
+        # Resume parse cache: lookup by content key, entries expire when unused
+        await mongodb.db.resume_parse_cache.create_index("key", unique=True)
+        await mongodb.db.resume_parse_cache.create_index(
+            "last_used_at",
+            expireAfterSeconds=int(float(os.getenv("RESUME_PARSE_CACHE_TTL_DAYS", "30")) * 86400)
+        )
+        
         logger.info("Database indexes created successfully")
     except Exception as e:
         logger.warning(f"Failed to create indexes: {e}")
 
+def database_available(read: bool = False) -> bool:
+    """
+    Whether database calls can currently succeed. After server checks have failed
+    this is False until the client reconnects, so callers fail fast instead of
+    each waiting out serverSelectionTimeoutMS.
+
+    Args:
+        read: Check for a server serving list reads instead of the primary
+    """
+    return topology_state.reachable(read_preference() if read else None)
+
 def get_database():
-    """Get database instance"""
+    """Get database instance; raises DatabaseUnavailableError while MongoDB is unreachable"""
+    if mongodb.db is not None and not database_available():
+        raise DatabaseUnavailableError("MongoDB is unreachable")
     return mongodb.db
+
+def get_read_database():
+    """Database instance for listing and matching reads, which tolerate replication lag"""
+    if mongodb.read_db is None:
+        return get_database()
+    if not database_available(read=True):
+        raise DatabaseUnavailableError("MongoDB is unreachable")
+    return mongodb.read_db
+
+def database_stats() -> Dict[str, Any]:
+    """Client options and connection pool utilization per server"""
+    servers = pool_stats.stats()
+    max_pool_size = mongodb.options.get("maxPoolSize")
+    if max_pool_size:
+        for counts in servers.values():
+            counts["utilization"] = round(counts["checked_out"] / max_pool_size, 3)
+    return {
+        "available": database_available(),
+        "options": mongodb.options,
+        "list_read_preference": os.getenv("MONGODB_LIST_READ_PREFERENCE", "secondaryPreferred"),
+        "pools": servers
+    }
@@ -0,0 +1,100 @@
+"""
+Connection pool monitoring for the MongoDB client
+"""
+import threading
+from collections import defaultdict
+from typing import Any, Dict
+from pymongo import monitoring
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Counts connection pool events per server; events arrive on driver threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "open": 0,
+            "checked_out": 0,
+            "max_checked_out": 0,
+            "created": 0,
+            "closed": 0,
+            "checkouts": 0,
+            "checkout_failures": 0,
+            "pool_clears": 0
+        })
+
+    def _update(self, event, **deltas: int):
+        with self._lock:
+            server = self._servers[f"{event.address[0]}:{event.address[1]}"]
+            for key, delta in deltas.items():
+                server[key] += delta
+            server["max_checked_out"] = max(server["max_checked_out"], server["checked_out"])
+
+    def pool_created(self, event):
+        self._update(event)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._update(event, pool_clears=1)
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._update(event, open=1, created=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._update(event, open=-1, closed=1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._update(event, checkout_failures=1)
+
+    def connection_checked_out(self, event):
+        self._update(event, checked_out=1, checkouts=1)
+
+    def connection_checked_in(self, event):
+        self._update(event, checked_out=-1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {address: dict(counts) for address, counts in self._servers.items()}
+
+class TopologyStateListener(monitoring.TopologyListener):
+    """Keeps the latest topology description, so callers can skip the database while it is unreachable"""
+
+    def __init__(self):
+        self._description = None
+
+    def opened(self, event):
+        pass
+
+    def description_changed(self, event):
+        self._description = event.new_description
+
+    def closed(self, event):
+        self._description = None
+
+    def reachable(self, read_preference=None) -> bool:
+        """
+        False once server checks have failed and no suitable server is known.
+
+        Args:
+            read_preference: Server needed for reads with this preference (default: a writable primary)
+        """
+        description = self._description
+        if description is None:
+            return True
+        if read_preference is None:
+            if description.has_writable_server():
+                return True
+        elif description.has_readable_server(read_preference):
+            return True
+        # Servers not checked yet (startup, elections) are not failures
+        return not any(server.error for server in description.server_descriptions().values())
@@ -1,9 +1,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
-from .database import connect_to_mongo, close_mongo_connection
+import os
+from .database import connect_to_mongo, close_mongo_connection, database_stats
 from .routers import jobs, resume, matching
+from .services.job_ingestion import get_ingestion_worker
+from .services.model_registry import registry
+from .services.resume_cache import get_resume_cache
+from .services.resume_parse_cache import get_parse_cache
+from .utils.executor import executor_stats, shutdown_executors
+from .utils.http_client import close_http_client
+from .utils.pdf_text import shutdown_pdf_executor
 
 # Configure logging
 logging.basicConfig(
@@ -25,11 +34,31 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to connect to MongoDB: {e}")
         logger.warning("Continuing without database connection - using fallback mode")
     
+    # Optionally load NLP models before serving the first request
+    if os.getenv("MODEL_WARMUP", "false").lower() == "true":
+        logger.info("Warming up models...")
+        await asyncio.to_thread(registry.warm_up)
+    
+    # Keep the job catalog fresh in the background (JOB_INGESTION_ENABLED)
+    get_ingestion_worker().start()
+    
+    # Write resumes kept in memory during database outages once it is back
+    get_resume_cache().start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Jobeez API...")
+    await get_ingestion_worker().stop()
+    await get_resume_cache().stop()
+    try:
+        await get_resume_cache().flush()
+    except Exception as e:
+        logger.warning(f"Could not write cached resumes on shutdown: {e}")
     await close_mongo_connection()
+    await close_http_client()
+    shutdown_executors()
+    shutdown_pdf_executor()
 
 app = FastAPI(
     title="Jobeez API",
@@ -49,6 +78,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Parse-Cache", "X-Parse-Cache-Hit-Ratio"],
 )
 
 # Include routers
@@ -70,5 +100,11 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "Jobeez API",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "models": registry.stats(),
+        "executors": executor_stats(),
+        "database": database_stats(),
+        "ingestion": get_ingestion_worker().stats(),
+        "resume_parse_cache": get_parse_cache().stats(),
+        "resume_cache": get_resume_cache().stats()
     } 
\ No newline at end of file
@@ -13,6 +13,8 @@ import io
 from collections import Counter
 import httpx
 from typing import Dict
+from app.services.skill_extractor import get_skill_extractor
+from app.utils.pdf_text import extract_pdf_text
 
 # Configure logging
 logging.basicConfig(
@@ -95,31 +97,13 @@ class JobMatch(BaseModel):
     missing_skills: List[str] = []
     recommendation: str
 
-# Skill database - common tech skills
-SKILL_DATABASE = {
-    "programming": ["python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go", "rust", "php", "swift", "kotlin"],
-    "web": ["react", "angular", "vue", "nextjs", "nodejs", "express", "django", "flask", "fastapi", "html", "css", "tailwind"],
-    "database": ["sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "dynamodb", "cassandra"],
-    "cloud": ["aws", "azure", "gcp", "docker", "kubernetes", "terraform", "jenkins", "ci/cd"],
-    "data": ["pandas", "numpy", "tensorflow", "pytorch", "scikit-learn", "spark", "hadoop", "tableau", "powerbi"],
-    "tools": ["git", "jira", "agile", "scrum", "rest", "graphql", "api", "microservices"]
-}
-
-# Flatten skill database for easy lookup
-ALL_SKILLS = set()
-for category, skills in SKILL_DATABASE.items():
-    ALL_SKILLS.update(skills)
+# Shared skill taxonomy matcher, compiled once at import
+skill_extractor = get_skill_extractor()
 
 def extract_text_from_pdf(file_content: bytes) -> str:
     """Extract text from PDF file"""
     try:
-        import PyPDF2
-        pdf_file = io.BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return extract_pdf_text(file_content)
     except Exception as e:
         logger.error(f"PDF extraction error: {e}")
         raise HTTPException(status_code=400, detail="Failed to extract text from PDF")
@@ -168,28 +152,15 @@ def extract_name(text: str) -> str:
     return "Unknown"
 
 def extract_skills(text: str) -> List[Skill]:
-    """Extract skills from text using keyword matching"""
-    text_lower = text.lower()
-    found_skills = []
-    
-    for skill in ALL_SKILLS:
-        # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            # Determine category
-            category = "general"
-            for cat, skills_list in SKILL_DATABASE.items():
-                if skill in skills_list:
-                    category = cat
-                    break
-            
-            found_skills.append(Skill(
-                name=skill.title(),
-                category=category,
-                confidence=1.0
-            ))
-    
-    return found_skills
+    """Extract skills from text using the shared skill taxonomy"""
+    return [
+        Skill(
+            name=skill,
+            category=skill_extractor.category(skill) or "general",
+            confidence=1.0
+        )
+        for skill in skill_extractor.extract(text)
+    ]
 
 def extract_experience(text: str) -> tuple[List[Experience], float]:
     """Extract work experience from text"""
@@ -390,10 +361,10 @@ MOCK_JOBS = [
 def calculate_job_match(resume: Resume, job: JobListing) -> JobMatch:
     """Calculate match score between resume and job"""
     
-    # Extract skill names from resume
-    resume_skills = set(skill.name.lower() for skill in resume.skills)
-    required_skills = set(skill.lower() for skill in job.required_skills)
-    preferred_skills = set(skill.lower() for skill in job.preferred_skills)
+    # Normalize skill names so aliases (e.g. "nodejs" / "Node.js") intersect
+    resume_skills = set(skill_extractor.normalize(skill.name) for skill in resume.skills)
+    required_skills = set(skill_extractor.normalize(skill) for skill in job.required_skills)
+    preferred_skills = set(skill_extractor.normalize(skill) for skill in job.preferred_skills)
     all_job_skills = required_skills | preferred_skills
     
     # Calculate skill match
@@ -438,8 +409,8 @@ def calculate_job_match(resume: Resume, job: JobListing) -> JobMatch:
         match_score=round(overall_score, 1),
         skill_match_score=round(skill_match_score, 1),
         experience_match_score=round(experience_match_score, 1),
-        matched_skills=[s.title() for s in matched_skills],
-        missing_skills=[s.title() for s in missing_skills],
+        matched_skills=matched_skills,
+        missing_skills=missing_skills,
         recommendation=recommendation
     )
 
@@ -492,13 +463,11 @@ async def fetch_real_jobs() -> List[JobListing]:
                     description = job.get('description', '')
                     tags = job.get('tags', [])
                     
-                    # Common tech skills to look for
-                    tech_skills = ['python', 'javascript', 'java', 'react', 'node', 'aws', 'docker', 'kubernetes']
-                    found_skills = [skill for skill in tech_skills if skill.lower() in description.lower()]
+                    found_skills = skill_extractor.extract(description)
                     
                     # Add tags as skills
-                    found_skills.extend([tag.lower() for tag in tags if isinstance(tag, str)])
-                    found_skills = list(set(found_skills))[:10]  # Unique, max 10
+                    found_skills.extend([skill_extractor.normalize(tag) for tag in tags if isinstance(tag, str)])
+                    found_skills = list(dict.fromkeys(found_skills))[:10]  # Unique, max 10
                     
                     jobs.append(JobListing(
                         id=f"remote_{idx}_{job.get('id', idx)}",
@@ -28,6 +28,29 @@ class JobListing(BaseModel):
     source: Optional[str] = None  # LinkedIn, Indeed, etc.
     created_at: datetime = Field(default_factory=datetime.now)
 
+class JobSummary(BaseModel):
+    """JobListing without the description, for list views and match candidate scoring"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: Optional[str] = None
+    title: str
+    company: str
+    location: Optional[str] = None
+    remote: Optional[bool] = False
+    skills: List[JobSkill] = []
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    experience_level: Optional[str] = None
+    job_type: Optional[str] = None
+    url: Optional[str] = None
+    posted_date: Optional[datetime] = None
+    source: Optional[str] = None
+    
+    @classmethod
+    def from_listing(cls, job: JobListing) -> "JobSummary":
+        """Summary of an already validated listing, without re-validating it"""
+        return cls.model_construct(**{field: getattr(job, field) for field in cls.model_fields})
+
 class JobMatch(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
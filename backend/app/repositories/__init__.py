@@ -1,4 +1,5 @@
 from .resume_repository import ResumeRepository
 from .job_repository import JobRepository
+from .embedding_repository import JobEmbeddingRepository
 
-__all__ = ["ResumeRepository", "JobRepository"]
+__all__ = ["ResumeRepository", "JobRepository", "JobEmbeddingRepository"]
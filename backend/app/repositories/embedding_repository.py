@@ -0,0 +1,101 @@
+"""
+Repository for job embedding database operations
+"""
+from typing import AsyncIterator, Dict, List, Optional, Any
+from datetime import datetime
+from pymongo import UpdateOne
+from app.database import get_database, get_read_database
+import logging
+
+logger = logging.getLogger(__name__)
+
+class JobEmbeddingRepository:
+    def __init__(self):
+        self.collection_name = "job_embeddings"
+    
+    async def get_many(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get stored embeddings for the given job IDs, keyed by job ID"""
+        try:
+            db = get_read_database()
+            cursor = db[self.collection_name].find(
+                {"job_id": {"$in": job_ids}},
+                {"_id": 0, "job_id": 1, "content_hash": 1, "vector": 1}
+            )
+            
+            records = {}
+            async for record in cursor:
+                records[record["job_id"]] = record
+            
+            return records
+        except Exception as e:
+            logger.error(f"Error getting job embeddings: {e}")
+            raise
+    
+    async def get_hashes(self, job_ids: List[str]) -> Dict[str, str]:
+        """Get the content hashes of stored embeddings, keyed by job ID"""
+        try:
+            db = get_read_database()
+            cursor = db[self.collection_name].find(
+                {"job_id": {"$in": job_ids}},
+                {"_id": 0, "job_id": 1, "content_hash": 1}
+            )
+            
+            return {record["job_id"]: record["content_hash"] async for record in cursor}
+        except Exception as e:
+            logger.error(f"Error getting job embedding hashes: {e}")
+            raise
+    
+    async def upsert_many(self, records: List[Dict[str, Any]]) -> int:
+        """Bulk insert or replace embeddings keyed by job ID"""
+        if not records:
+            return 0
+        
+        try:
+            db = get_database()
+            now = datetime.now()
+            operations = [
+                UpdateOne(
+                    {"job_id": record["job_id"]},
+                    {"$set": {**record, "updated_at": now}},
+                    upsert=True
+                )
+                for record in records
+            ]
+            
+            result = await db[self.collection_name].bulk_write(operations, ordered=False)
+            written = result.upserted_count + result.modified_count
+            logger.info(f"Stored {written} job embeddings")
+            return written
+        except Exception as e:
+            logger.error(f"Error storing job embeddings: {e}")
+            raise
+    
+    async def iter_all(self,
+                       updated_since: Optional[datetime] = None,
+                       batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every stored embedding, or those written at or after updated_since"""
+        try:
+            db = get_read_database()
+            query = {"updated_at": {"$gte": updated_since}} if updated_since else {}
+            cursor = db[self.collection_name].find(
+                query,
+                {"_id": 0, "job_id": 1, "content_hash": 1, "vector": 1, "updated_at": 1}
+            ).batch_size(batch_size)
+            
+            async for record in cursor:
+                yield record
+        except Exception as e:
+            logger.error(f"Error iterating job embeddings: {e}")
+            raise
+    
+    async def delete_many(self, job_ids: List[str]) -> int:
+        """Delete embeddings for the given job IDs"""
+        try:
+            db = get_database()
+            result = await db[self.collection_name].delete_many({"job_id": {"$in": job_ids}})
+            
+            logger.info(f"Deleted {result.deleted_count} job embeddings")
+            return result.deleted_count
+        except Exception as e:
+            logger.error(f"Error deleting job embeddings: {e}")
+            raise
@@ -1,29 +1,58 @@
 """
 Repository for Job database operations
 """
-from typing import Optional, List
-from datetime import datetime
-from app.models.job import JobListing
-from app.database import get_database
+from typing import Any, Dict, Optional, List, Tuple, Union
+from datetime import datetime, timedelta
+import hashlib
+import json
+import os
+import re
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from app.models.job import JobListing, JobSummary
+from app.database import get_database, get_read_database
+from app.repositories.pagination import encode_cursor, keyset_filter, keyset_sort
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Lowercased copies of these fields are stored as <field>_lc for indexed prefix search
+SEARCH_FIELDS = ("title", "company", "location")
+SEARCH_MODES = ("prefix", "text", "regex")
+
+# Only the JobSummary fields; descriptions are often several KB
+SUMMARY_PROJECTION = {"_id": 0, **{field: 1 for field in JobSummary.model_fields}}
+
+def normalize_search_value(value: Optional[str]) -> str:
+    """Normalization applied to stored *_lc fields and to prefix search terms"""
+    return (value or "").strip().lower()
+
+def with_search_fields(job_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the normalized prefix-search fields to a job document"""
+    for field in SEARCH_FIELDS:
+        job_dict[f"{field}_lc"] = normalize_search_value(job_dict.get(field))
+    return job_dict
+
 class JobRepository:
     def __init__(self):
         self.collection_name = "jobs"
+        # regex: case-insensitive substring match (default, unindexed), prefix: anchored
+        # match on the indexed *_lc fields, text: the text index. prefix and text are
+        # opt-in since they change results: "engineer" no longer finds "Software Engineer"
+        self.search_mode = os.getenv("JOB_SEARCH_MODE", "regex")
     
     async def create(self, job: JobListing) -> JobListing:
         """Create a new job in the database"""
         try:
             db = get_database()
-            job_dict = job.model_dump()
+            job_dict = with_search_fields(job.model_dump())
             job_dict["created_at"] = datetime.now()
             
-            result = await db[self.collection_name].insert_one(job_dict)
-            job_dict["_id"] = str(result.inserted_id)
+            await db[self.collection_name].insert_one(job_dict)
             
             logger.info(f"Created job with ID: {job.id}")
+            await self._store_embeddings([job])
+            job_dict.pop("_id", None)
             return JobListing(**job_dict)
         except Exception as e:
             logger.error(f"Error creating job: {e}")
@@ -33,18 +62,136 @@ class JobRepository:
         """Bulk create jobs"""
         try:
             db = get_database()
-            job_dicts = [job.model_dump() for job in jobs]
+            job_dicts = [with_search_fields(job.model_dump()) for job in jobs]
             
             for job_dict in job_dicts:
                 job_dict["created_at"] = datetime.now()
             
             result = await db[self.collection_name].insert_many(job_dicts)
             logger.info(f"Created {len(result.inserted_ids)} jobs")
+            await self._store_embeddings(jobs)
             return len(result.inserted_ids)
         except Exception as e:
             logger.error(f"Error bulk creating jobs: {e}")
             raise
     
+    @staticmethod
+    def external_id(job: JobListing) -> str:
+        """Stable identity of a job across ingestion runs"""
+        if job.id:
+            return f"{(job.source or 'unknown').lower()}:{job.id}"
+        key = job.url or f"{job.title}|{job.company}|{job.location}"
+        return f"{(job.source or 'unknown').lower()}:{hashlib.sha256(key.encode('utf-8')).hexdigest()[:24]}"
+    
+    @staticmethod
+    def content_hash(job: JobListing) -> str:
+        """Hash of the job content; timestamps are excluded since sources fill them with 'now'"""
+        content = job.model_dump(mode="json", exclude={"id", "created_at", "posted_date"})
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    async def upsert_many(self, jobs: List[JobListing]) -> Dict[str, int]:
+        """
+        Insert new jobs and update changed ones, skipping unchanged documents.
+        
+        Jobs are matched by external ID, or by ID for documents written without one
+        (create_many, init_db), which get their external ID backfilled. Writes that
+        fail are counted as errors; the others are still embedded.
+        """
+        try:
+            db = get_database()
+            collection = db[self.collection_name]
+            
+            # Last write wins for duplicates within one batch
+            by_external_id = {self.external_id(job): job for job in jobs}
+            hashes = {external_id: self.content_hash(job) for external_id, job in by_external_id.items()}
+            job_ids = [job.id for job in by_external_id.values() if job.id]
+            
+            by_stored_external_id, by_stored_id = {}, {}
+            async for doc in collection.find(
+                    {"$or": [{"external_id": {"$in": list(by_external_id)}}, {"id": {"$in": job_ids}}]},
+                    {"_id": 0, "external_id": 1, "content_hash": 1, "id": 1}):
+                if doc.get("external_id"):
+                    by_stored_external_id[doc["external_id"]] = doc
+                by_stored_id[doc["id"]] = doc
+            
+            now = datetime.now()
+            operations = []
+            changed_jobs = []
+            taken_ids = set(by_stored_id)
+            for external_id, job in by_external_id.items():
+                existing = by_stored_external_id.get(external_id)
+                match = {"external_id": external_id}
+                if existing is None and job.id in by_stored_id:
+                    legacy = by_stored_id[job.id]
+                    if not legacy.get("external_id"):
+                        # Written before external IDs existed: update it in place
+                        existing, match = legacy, {"id": job.id}
+                
+                if existing and existing.get("content_hash") == hashes[external_id]:
+                    continue
+                
+                job_dict = with_search_fields(job.model_dump(exclude={"created_at"}))
+                # Keep the ID a stored job already has so references to it stay valid; a new
+                # job whose source ID is taken by another source's job gets its external ID
+                if existing:
+                    job_dict["id"] = existing["id"]
+                elif job.id and job.id not in taken_ids:
+                    job_dict["id"] = job.id
+                else:
+                    job_dict["id"] = external_id
+                taken_ids.add(job_dict["id"])
+                job_dict.update(external_id=external_id, content_hash=hashes[external_id], updated_at=now)
+                
+                operations.append(UpdateOne(
+                    match,
+                    {"$set": job_dict, "$setOnInsert": {"created_at": now}},
+                    upsert=True
+                ))
+                changed_jobs.append(job.model_copy(update={"id": job_dict["id"]}))
+            
+            inserted = updated = errors = 0
+            if operations:
+                try:
+                    result = await collection.bulk_write(operations, ordered=False)
+                    inserted, updated = result.upserted_count, result.modified_count
+                except BulkWriteError as e:
+                    # Unordered: every operation without a write error was applied
+                    write_errors = e.details.get("writeErrors", [])
+                    failed = {error["index"] for error in write_errors}
+                    logger.warning(f"Could not write {len(failed)} jobs: {write_errors[0].get('errmsg')}")
+                    inserted, updated, errors = e.details.get("nUpserted", 0), e.details.get("nModified", 0), len(failed)
+                    changed_jobs = [job for index, job in enumerate(changed_jobs) if index not in failed]
+                await self._store_embeddings(changed_jobs)
+            
+            counts = {
+                "received": len(jobs),
+                "inserted": inserted,
+                "updated": updated,
+                "unchanged": len(by_external_id) - len(operations),
+                "errors": errors
+            }
+            logger.info(f"Upserted jobs: {counts}")
+            return counts
+        except Exception as e:
+            logger.error(f"Error upserting jobs: {e}")
+            raise
+    
+    async def _remove_embeddings(self, job_ids: List[str]):
+        """Drop embeddings of deleted jobs from the store and vector index"""
+        try:
+            from app.services.embedding_store import get_job_embedding_store
+            await get_job_embedding_store().remove_jobs(job_ids)
+        except Exception as e:
+            logger.warning(f"Could not remove job embeddings: {e}")
+    
+    async def _store_embeddings(self, jobs: List[JobListing]):
+        """Embed newly written jobs so matching can reuse their vectors"""
+        try:
+            from app.services.embedding_store import get_job_embedding_store
+            await get_job_embedding_store().upsert_jobs(jobs)
+        except Exception as e:
+            logger.warning(f"Could not store job embeddings: {e}")
+    
     async def get_by_id(self, job_id: str) -> Optional[JobListing]:
         """Get a job by ID"""
         try:
@@ -59,18 +206,51 @@ class JobRepository:
             logger.error(f"Error getting job {job_id}: {e}")
             raise
     
-    async def list_all(self, skip: int = 0, limit: int = 100) -> List[JobListing]:
-        """List all jobs with pagination"""
+    async def get_many(self, job_ids: List[str], summary: bool = False) -> List[Union[JobListing, JobSummary]]:
+        """Get jobs by a list of IDs (as summaries if summary is True)"""
         try:
-            db = get_database()
-            cursor = db[self.collection_name].find().skip(skip).limit(limit).sort("posted_date", -1)
+            db = get_read_database()
+            cursor = db[self.collection_name].find({"id": {"$in": job_ids}}, self._projection(summary))
             
+            model = JobSummary if summary else JobListing
             jobs = []
             async for job_dict in cursor:
                 job_dict.pop("_id", None)
-                jobs.append(JobListing(**job_dict))
+                jobs.append(model(**job_dict))
             
             return jobs
+        except Exception as e:
+            logger.error(f"Error getting jobs: {e}")
+            raise
+    
+    async def list_all(self,
+                       skip: int = 0,
+                       limit: int = 100,
+                       summary: bool = False) -> List[Union[JobListing, JobSummary]]:
+        """List all jobs with pagination (as summaries if summary is True)"""
+        try:
+            db = get_read_database()
+            cursor = db[self.collection_name].find({}, self._projection(summary)) \
+                .sort(keyset_sort("posted_date")).skip(skip).limit(limit)
+            
+            model = JobSummary if summary else JobListing
+            jobs = []
+            async for job_dict in cursor:
+                job_dict.pop("_id", None)
+                jobs.append(model(**job_dict))
+            
+            return jobs
+        except Exception as e:
+            logger.error(f"Error listing jobs: {e}")
+            raise
+    
+    async def list_page(self,
+                        limit: int = 100,
+                        cursor: Optional[str] = None,
+                        summary: bool = False) -> Tuple[List[Union[JobListing, JobSummary]], Optional[str]]:
+        """List jobs newest first using keyset pagination; returns the page and the next cursor"""
+        try:
+            return await self._find_page({}, limit, cursor, summary)
         except Exception as e:
             logger.error(f"Error listing jobs: {e}")
             raise
@@ -81,21 +261,12 @@ class JobRepository:
                     location: Optional[str] = None,
                     remote: Optional[bool] = None,
                     skip: int = 0, 
-                    limit: int = 100) -> List[JobListing]:
+                    limit: int = 100,
+                    mode: Optional[str] = None) -> List[JobListing]:
         """Search jobs with filters"""
         try:
-            db = get_database()
-            
-            # Build query
-            query = {}
-            if title:
-                query["title"] = {"$regex": title, "$options": "i"}
-            if company:
-                query["company"] = {"$regex": company, "$options": "i"}
-            if location:
-                query["location"] = {"$regex": location, "$options": "i"}
-            if remote is not None:
-                query["remote"] = remote
+            db = get_read_database()
+            query = self.search_query(title, company, location, remote, mode)
             
             cursor = db[self.collection_name].find(query).skip(skip).limit(limit).sort("posted_date", -1)
             
@@ -109,17 +280,110 @@ class JobRepository:
             logger.error(f"Error searching jobs: {e}")
             raise
     
+    async def search_page(self,
+                          title: Optional[str] = None,
+                          company: Optional[str] = None,
+                          location: Optional[str] = None,
+                          remote: Optional[bool] = None,
+                          limit: int = 100,
+                          cursor: Optional[str] = None,
+                          mode: Optional[str] = None,
+                          summary: bool = False) -> Tuple[List[Union[JobListing, JobSummary]], Optional[str]]:
+        """Search jobs with filters using keyset pagination"""
+        try:
+            query = self.search_query(title, company, location, remote, mode)
+            return await self._find_page(query, limit, cursor, summary)
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            raise
+    
+    def search_query(self,
+                     title: Optional[str] = None,
+                     company: Optional[str] = None,
+                     location: Optional[str] = None,
+                     remote: Optional[bool] = None,
+                     mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the filter for a job search.
+        
+        Args:
+            mode: "regex" (default, JOB_SEARCH_MODE) is the unindexed case-insensitive
+                  substring match, "prefix" matches the start of title/company/location
+                  through their indexed *_lc fields, "text" matches title words through
+                  the text index and company/location as prefixes
+        """
+        mode = mode or self.search_mode
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}")
+        
+        filters = {"title": title, "company": company, "location": location}
+        query = {}
+        
+        if mode == "regex":
+            for field, value in filters.items():
+                if value:
+                    query[field] = {"$regex": value, "$options": "i"}
+        else:
+            if mode == "text":
+                # $text ORs its words across title, description and company, so only the
+                # title goes through it; company and location stay prefix filters
+                if title:
+                    query["$text"] = {"$search": title}
+                filters = {"company": company, "location": location}
+            
+            for field, value in filters.items():
+                value = normalize_search_value(value)
+                if value:
+                    # Anchored, case-sensitive regexes on normalized fields become index range scans
+                    query[f"{field}_lc"] = {"$regex": f"^{re.escape(value)}"}
+        
+        if remote is not None:
+            query["remote"] = remote
+        return query
+    
+    @staticmethod
+    def _projection(summary: bool) -> Optional[Dict[str, int]]:
+        return SUMMARY_PROJECTION if summary else None
+    
+    async def _find_page(self,
+                         query: Dict[str, Any],
+                         limit: int,
+                         cursor: Optional[str],
+                         summary: bool = False) -> Tuple[List[Union[JobListing, JobSummary]], Optional[str]]:
+        """One page in (posted_date, id) descending order, starting after the cursor"""
+        db = get_read_database()
+        after = keyset_filter("posted_date", cursor)
+        if after:
+            query = {"$and": [query, after]} if query else after
+        
+        # Fetch one extra document to know whether another page follows
+        docs = db[self.collection_name].find(query, self._projection(summary)) \
+            .sort(keyset_sort("posted_date")).limit(limit + 1)
+        
+        model = JobSummary if summary else JobListing
+        jobs = []
+        async for job_dict in docs:
+            job_dict.pop("_id", None)
+            jobs.append(model(**job_dict))
+        
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_cursor(jobs[-1].posted_date, jobs[-1].id or "")
+        return jobs, next_cursor
+    
     async def delete_old_jobs(self, days: int = 30) -> int:
         """Delete jobs older than specified days"""
         try:
             db = get_database()
-            cutoff_date = datetime.now() - datetime.timedelta(days=days)
+            cutoff_date = datetime.now() - timedelta(days=days)
+            query = {"posted_date": {"$lt": cutoff_date}}
             
-            result = await db[self.collection_name].delete_many({
-                "posted_date": {"$lt": cutoff_date}
-            })
+            job_ids = await db[self.collection_name].distinct("id", query)
+            result = await db[self.collection_name].delete_many(query)
             
             logger.info(f"Deleted {result.deleted_count} old jobs")
+            await self._remove_embeddings(job_ids)
             return result.deleted_count
         except Exception as e:
             logger.error(f"Error deleting old jobs: {e}")
@@ -128,7 +392,7 @@ class JobRepository:
     async def count(self) -> int:
         """Count total jobs"""
         try:
-            db = get_database()
+            db = get_read_database()
             count = await db[self.collection_name].count_documents({})
             return count
         except Exception as e:
@@ -0,0 +1,91 @@
+"""
+Keyset (cursor) pagination helpers
+Pages are ordered by (sort field desc, id desc) and continue strictly after the
+last item of the previous page, so deep pages cost the same as the first one
+"""
+import base64
+import bisect
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor cannot be decoded"""
+
+def encode_cursor(sort_value: Any, item_id: str) -> str:
+    """Opaque cursor for the position just after an item"""
+    if isinstance(sort_value, datetime):
+        sort_value = {"$dt": sort_value.isoformat()}
+    payload = json.dumps([sort_value, item_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor into (sort value, id)"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, item_id = json.loads(payload)
+        if isinstance(sort_value, dict):
+            sort_value = datetime.fromisoformat(sort_value["$dt"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(item_id, str):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return sort_value, item_id
+
+def keyset_filter(sort_field: str, cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    MongoDB filter for documents after the cursor in (sort_field desc, id desc) order.
+    Descending sorts put null/missing values last, so they come after every dated document.
+    """
+    if not cursor:
+        return {}
+
+    sort_value, item_id = decode_cursor(cursor)
+    if sort_value is None:
+        return {sort_field: None, "id": {"$lt": item_id}}
+
+    return {"$or": [
+        {sort_field: {"$lt": sort_value}},
+        {sort_field: sort_value, "id": {"$lt": item_id}},
+        {sort_field: None}
+    ]}
+
+def keyset_sort(sort_field: str) -> List[Tuple[str, int]]:
+    return [(sort_field, -1), ("id", -1)]
+
+def _sort_key(sort_value: Any, item_id: Optional[str]) -> Tuple[bool, Any, str]:
+    # Aware datetimes are compared as naive UTC, the form MongoDB returns
+    if isinstance(sort_value, datetime) and sort_value.tzinfo is not None:
+        sort_value = sort_value.astimezone(timezone.utc).replace(tzinfo=None)
+    # Items without a sort value order below every dated item, as in MongoDB
+    return (sort_value is not None, sort_value if sort_value is not None else 0, item_id or "")
+
+class KeysetIndex:
+    """In-memory equivalent of a keyset-paginated query over a fixed list of items"""
+
+    def __init__(self, items: Sequence[Any], sort_value: Callable[[Any], Any], item_id: Callable[[Any], str]):
+        self._sort_value = sort_value
+        self._item_id = item_id
+        # Ascending order, so a cursor position can be found with bisect
+        self._items = sorted(items, key=lambda item: _sort_key(sort_value(item), item_id(item)))
+        self._keys = [_sort_key(sort_value(item), item_id(item)) for item in self._items]
+
+    @property
+    def items(self) -> List[Any]:
+        """All items in page order"""
+        return self._items[::-1]
+
+    def page(self, limit: int, cursor: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+        """Return up to limit items after the cursor and the cursor of the next page"""
+        end = len(self._items)
+        if cursor:
+            end = bisect.bisect_left(self._keys, _sort_key(*decode_cursor(cursor)))
+
+        start = max(0, end - limit)
+        page = self._items[start:end][::-1]
+        next_cursor = None
+        if start > 0 and page:
+            last = page[-1]
+            next_cursor = encode_cursor(self._sort_value(last), self._item_id(last))
+        return page, next_cursor
@@ -0,0 +1,43 @@
+"""
+Repository for cached resume parse results, keyed by the uploaded file's SHA-256
+"""
+from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from app.database import get_database
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ResumeParseCacheRepository:
+    def __init__(self):
+        self.collection_name = "resume_parse_cache"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached parse result by cache key"""
+        try:
+            db = get_database()
+            record = await db[self.collection_name].find_one({"key": key}, {"_id": 0})
+            if record:
+                # Keep frequently re-uploaded files from expiring
+                await db[self.collection_name].update_one({"key": key},
+                                                          {"$set": {"last_used_at": datetime.now(timezone.utc)}})
+            return record
+        except Exception as e:
+            logger.error(f"Error getting cached resume parse {key}: {e}")
+            raise
+
+    async def set(self, key: str, parsed: Dict[str, Any], parse_seconds: float):
+        """Store a parse result"""
+        try:
+            db = get_database()
+            # The TTL index reads stored dates as UTC
+            now = datetime.now(timezone.utc)
+            await db[self.collection_name].update_one(
+                {"key": key},
+                {"$set": {"parsed": parsed, "parse_seconds": parse_seconds, "last_used_at": now},
+                 "$setOnInsert": {"created_at": now}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error caching resume parse {key}: {e}")
+            raise
@@ -1,10 +1,11 @@
 """
 Repository for Resume database operations
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from app.models.resume import Resume
-from app.database import get_database
+from app.database import get_database, get_read_database
+from app.repositories.pagination import encode_cursor, keyset_filter, keyset_sort
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,15 +22,33 @@ class ResumeRepository:
             resume_dict["created_at"] = datetime.now()
             resume_dict["updated_at"] = datetime.now()
             
-            result = await db[self.collection_name].insert_one(resume_dict)
-            resume_dict["_id"] = str(result.inserted_id)
+            await db[self.collection_name].insert_one(resume_dict)
             
             logger.info(f"Created resume with ID: {resume.id}")
+            resume_dict.pop("_id", None)
             return Resume(**resume_dict)
         except Exception as e:
             logger.error(f"Error creating resume: {e}")
             raise
     
+    async def create_many(self, resumes: List[Resume]) -> int:
+        """Bulk create resumes"""
+        try:
+            db = get_database()
+            now = datetime.now()
+            resume_dicts = [resume.model_dump() for resume in resumes]
+
+            for resume_dict in resume_dicts:
+                resume_dict["created_at"] = now
+                resume_dict["updated_at"] = now
+
+            result = await db[self.collection_name].insert_many(resume_dicts, ordered=False)
+            logger.info(f"Created {len(result.inserted_ids)} resumes")
+            return len(result.inserted_ids)
+        except Exception as e:
+            logger.error(f"Error bulk creating resumes: {e}")
+            raise
+
     async def get_by_id(self, resume_id: str) -> Optional[Resume]:
         """Get a resume by ID"""
         try:
@@ -81,7 +100,7 @@ class ResumeRepository:
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Resume]:
         """List all resumes with pagination"""
         try:
-            db = get_database()
+            db = get_read_database()
             cursor = db[self.collection_name].find().skip(skip).limit(limit).sort("created_at", -1)
             
             resumes = []
@@ -94,10 +113,31 @@ class ResumeRepository:
             logger.error(f"Error listing resumes: {e}")
             raise
     
+    async def list_page(self, limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Resume], Optional[str]]:
+        """List resumes newest first using keyset pagination; returns the page and the next cursor"""
+        try:
+            db = get_read_database()
+            docs = db[self.collection_name].find(keyset_filter("created_at", cursor)) \
+                .sort(keyset_sort("created_at")).limit(limit + 1)
+            
+            resumes = []
+            async for resume_dict in docs:
+                resume_dict.pop("_id", None)
+                resumes.append(Resume(**resume_dict))
+            
+            next_cursor = None
+            if len(resumes) > limit:
+                resumes = resumes[:limit]
+                next_cursor = encode_cursor(resumes[-1].created_at, resumes[-1].id or "")
+            return resumes, next_cursor
+        except Exception as e:
+            logger.error(f"Error listing resumes: {e}")
+            raise
+    
     async def search(self, query: str, skip: int = 0, limit: int = 100) -> List[Resume]:
         """Search resumes by text query"""
         try:
-            db = get_database()
+            db = get_read_database()
             cursor = db[self.collection_name].find(
                 {"$text": {"$search": query}}
             ).skip(skip).limit(limit)
@@ -3,20 +3,14 @@ from typing import List, Optional
 from ..services.resume_parser import ResumeParser
 from ..services.job_scraper import JobScraper
 from ..services.job_matcher import JobMatcher
-import os
-from datetime import datetime
-import shutil
-from pathlib import Path
+from ..services.resume_parse_cache import get_parse_cache
+from ..utils.executor import run_blocking, run_cpu
 
 router = APIRouter()
 resume_parser = ResumeParser()
 job_scraper = JobScraper()
 job_matcher = JobMatcher()
 
-# Create uploads directory if it doesn't exist
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
-
 @router.post("/parse-resume")
 async def parse_resume(file: UploadFile = File(...)):
     """
@@ -36,28 +30,19 @@ async def parse_resume(file: UploadFile = File(...)):
         )
     
     try:
-        # Save uploaded file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = UPLOAD_DIR / f"{timestamp}_{file.filename}"
-        
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # Parse resume
-        parsed_data = resume_parser.parse_resume(str(file_path))
-        
-        # Clean up uploaded file
-        file_path.unlink()
+        # Parse the upload from memory on the CPU executor; bytes also cross to process workers.
+        # Identical files reuse the earlier parse.
+        content = await file.read()
+        parsed_data, cache_status = await get_parse_cache().parse(
+            content, lambda: run_cpu(resume_parser.parse_resume, content, file.filename))
         
         return {
             "status": "success",
-            "data": parsed_data
+            "data": parsed_data,
+            "cache": cache_status
         }
         
     except Exception as e:
-        # Clean up file if it exists
-        if file_path.exists():
-            file_path.unlink()
         raise HTTPException(
             status_code=500,
             detail=f"Error parsing resume: {str(e)}"
@@ -83,7 +68,8 @@ async def get_jobs(
         List of job listings
     """
     try:
-        jobs = job_scraper.get_jobs(
+        jobs = await run_blocking(
+            job_scraper.get_jobs,
             sources=sources,
             keywords=keywords,
             location=location,
@@ -125,15 +111,17 @@ async def match_jobs(
     """
     try:
         # Get jobs
-        jobs = job_scraper.get_jobs(
+        jobs = await run_blocking(
+            job_scraper.get_jobs,
             sources=sources,
             keywords=keywords,
             location=location,
             max_jobs=max_jobs * 2  # Fetch more jobs to ensure we have enough after filtering
         )
         
-        # Match jobs
-        matches = job_matcher.match_jobs(
+        # Match jobs (in a thread: the matcher's skill cache and embeddings are in-process)
+        matches = await run_blocking(
+            job_matcher.match_jobs,
             resume_data=resume_data,
             jobs=jobs,
             top_k=max_jobs
@@ -170,7 +158,8 @@ async def analyze_resume(
         # Get sample jobs for the target role if specified
         sample_jobs = []
         if target_job_title:
-            sample_jobs = job_scraper.get_jobs(
+            sample_jobs = await run_blocking(
+                job_scraper.get_jobs,
                 keywords=[target_job_title],
                 sources=['mock'],
                 max_jobs=5
@@ -178,12 +167,11 @@ async def analyze_resume(
         
         # Extract skills from sample jobs
         target_skills = set()
-        for job in sample_jobs:
-            job_skills = job_matcher._extract_skills_from_text(job['description'])
+        for job_skills in await run_blocking(job_matcher.get_jobs_skills, sample_jobs):
             target_skills.update(job_skills)
         
         # Get resume skills
-        resume_skills = set(resume_data.get('skills', []))
+        resume_skills = job_matcher.normalize_skills(resume_data.get('skills', []))
         
         # Calculate missing skills
         missing_skills = target_skills - resume_skills
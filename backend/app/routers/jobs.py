@@ -1,18 +1,36 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
-from app.models.job import JobListing
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Optional, Union
+from app.models.job import JobListing, JobSummary
+from app.repositories.pagination import InvalidCursorError
 from app.services.job_service import JobService
 
 router = APIRouter()
 job_service = JobService()
 
-@router.get("/", response_model=List[JobListing])
+@router.get("/", response_model=Union[List[JobListing], List[JobSummary]])
 async def get_jobs(
+    response: Response,
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    view: str = Query("full", pattern="^(full|summary)$", description="summary omits job descriptions")
 ):
-    """Get job listings with pagination"""
-    jobs = await job_service.get_job_listings(limit=limit, offset=offset)
+    """Get job listings with pagination (offset, or keyset via cursor)"""
+    if offset and cursor:
+        raise HTTPException(status_code=400, detail="Use either offset or cursor, not both")
+    
+    summary = view == "summary"
+    if offset:
+        return await job_service.get_job_listings(limit=limit, offset=offset, summary=summary)
+    
+    # First page or cursor page: keyset pagination, next page cursor in a header
+    try:
+        jobs, next_cursor = await job_service.get_job_page(limit=limit, cursor=cursor, summary=summary)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return jobs
 
 @router.get("/{job_id}", response_model=JobListing)
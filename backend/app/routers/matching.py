@@ -4,7 +4,7 @@ import logging
 from app.models.job import JobMatch
 from app.services.matching_service import MatchingService
 from app.repositories.resume_repository import ResumeRepository
-from app.routers.resume import resumes_cache
+from app.services.resume_cache import get_resume_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +25,8 @@ async def match_resume_to_jobs(
     except Exception as e:
         logger.warning(f"Database error, checking cache: {e}")
     
-    if not resume and resume_id in resumes_cache:
-        resume = resumes_cache[resume_id]
+    if not resume:
+        resume = get_resume_cache().get(resume_id)
     
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
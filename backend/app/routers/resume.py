@@ -1,5 +1,7 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Response
+from fastapi.responses import StreamingResponse
 from typing import List
+import json
 import os
 import uuid
 import logging
@@ -7,6 +9,10 @@ from app.services.resume_parser import ResumeParser
 from app.models.resume import Resume, ResumeImprovement
 from app.services.matching_service import MatchingService
 from app.repositories.resume_repository import ResumeRepository
+from app.services.resume_batch import get_batch_processor
+from app.services.resume_parse_cache import get_parse_cache
+from app.services.resume_cache import get_resume_cache
+from app.utils.executor import run_cpu
 
 logger = logging.getLogger(__name__)
 
@@ -15,19 +21,26 @@ resume_parser = ResumeParser()
 matching_service = MatchingService()
 resume_repository = ResumeRepository()
 
-# Fallback in-memory storage if database is unavailable
-resumes_cache = {}
+# Bounded fallback storage while the database is unavailable, written through once it returns
+resumes_cache = get_resume_cache()
 
 @router.post("/upload", response_model=Resume)
-async def upload_resume(file: UploadFile = File(...)):
-    """Upload and parse a resume file (PDF or DOCX)"""
+async def upload_resume(response: Response, file: UploadFile = File(...)):
+    """Upload and parse a resume file (PDF or DOCX); X-Parse-Cache reports whether parsing was skipped"""
     # Check file extension
     if not file.filename.lower().endswith(('.pdf', '.docx')):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
     
     try:
-        # Parse resume
-        resume = await resume_parser.parse_resume(file.file, file.filename)
+        # Identical files reuse the earlier parse; otherwise parse on the CPU executor
+        content = await file.read()
+        parse_cache = get_parse_cache()
+        parsed_data, cache_status = await parse_cache.parse(
+            content, lambda: run_cpu(resume_parser.parse_resume, content, file.filename))
+        resume = resume_parser.to_resume(parsed_data)
+        
+        response.headers["X-Parse-Cache"] = cache_status
+        response.headers["X-Parse-Cache-Hit-Ratio"] = str(parse_cache.stats()["hit_ratio"])
         
         # Generate ID
         resume.id = str(uuid.uuid4())
@@ -39,13 +52,28 @@ async def upload_resume(file: UploadFile = File(...)):
             return stored_resume
         except Exception as db_error:
             logger.warning(f"Database unavailable, using cache: {db_error}")
-            resumes_cache[resume.id] = resume
+            resumes_cache.add(resume)
             return resume
         
     except Exception as e:
         logger.error(f"Error parsing resume: {e}")
         raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
 
+@router.post("/batch")
+async def upload_resume_batch(files: List[UploadFile] = File(...)):
+    """
+    Upload and parse many resumes (PDF/DOCX files or zip archives of them).
+    Streams newline-delimited JSON: one line per file as it is stored, then a summary line.
+    """
+    processor = get_batch_processor()
+    uploads, rejected = await processor.read_uploads(files)
+    
+    async def results():
+        async for result in processor.process(uploads, fallback_cache=resumes_cache, rejected_uploads=rejected):
+            yield json.dumps(result) + "\n"
+    
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
 @router.get("/{resume_id}", response_model=Resume)
 async def get_resume(resume_id: str):
     """Get a parsed resume by ID"""
@@ -58,8 +86,9 @@ async def get_resume(resume_id: str):
         logger.warning(f"Database error, checking cache: {e}")
     
     # Check cache
-    if resume_id in resumes_cache:
-        return resumes_cache[resume_id]
+    resume = resumes_cache.get(resume_id)
+    if resume:
+        return resume
     
     raise HTTPException(status_code=404, detail="Resume not found")
 
@@ -73,8 +102,8 @@ async def get_resume_improvement(resume_id: str):
     except Exception as e:
         logger.warning(f"Database error, checking cache: {e}")
     
-    if not resume and resume_id in resumes_cache:
-        resume = resumes_cache[resume_id]
+    if not resume:
+        resume = resumes_cache.get(resume_id)
     
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -0,0 +1,299 @@
+"""
+Job embedding store
+Keeps one float32 vector per job together with a hash of the embedded text,
+so job descriptions are only re-encoded when their content changes
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from app.models.job import JobListing
+from app.repositories.embedding_repository import JobEmbeddingRepository
+from app.services.model_registry import encode_texts, get_sentence_transformer
+from app.services.vector_index import IVFIndex
+from app.utils.cache import LRUCache
+from app.utils.executor import run_cpu
+
+logger = logging.getLogger(__name__)
+
+class JobEmbeddingStore:
+    def __init__(self, repository: Optional[JobEmbeddingRepository] = None):
+        self.repository = repository or JobEmbeddingRepository()
+        # catalog job ID -> (content hash, vector)
+        self._vectors: Dict[str, Tuple[str, np.ndarray]] = {}
+        # Jobs outside the catalog (scraped results), by URL or content hash -> (content hash, vector)
+        self._local = LRUCache(max_entries=int(os.getenv("LOCAL_EMBEDDING_CACHE_SIZE", "10000")))
+        # ANN index over vectors of catalog jobs (keyed by job ID only)
+        self.index = IVFIndex(n_probe=int(os.getenv("VECTOR_INDEX_N_PROBE", "16")))
+        # Other processes (workers, ingestion, init_db) write embeddings too, so the
+        # index is refreshed from job_embeddings every VECTOR_INDEX_REFRESH_SECONDS
+        self.index_refresh_interval = float(os.getenv("VECTOR_INDEX_REFRESH_SECONDS", "60"))
+        # Latest updated_at seen in job_embeddings; None until the first full load succeeds
+        self._index_watermark: Optional[datetime] = None
+        self._index_loaded = False
+        self._index_checked_at = 0.0
+        self._index_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def model(self):
+        """Shared sentence transformer used to encode job texts"""
+        return get_sentence_transformer()
+
+    @staticmethod
+    def job_text(job: JobListing) -> str:
+        """Text that is embedded for a job"""
+        return job.description
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Hash of the embedded text, used to detect stale vectors"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def get_embeddings(self, jobs: List[JobListing]) -> np.ndarray:
+        """Get embeddings for jobs, reusing stored vectors whose hash still matches"""
+        if not jobs:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        texts = [self.job_text(job) for job in jobs]
+        hashes = [self.content_hash(text) for text in texts]
+        keys = [job.id or content_hash for job, content_hash in zip(jobs, hashes)]
+
+        # Only jobs with an ID are persisted; the rest live in the bounded local tier by hash
+        job_ids = {job.id for job in jobs if job.id}
+
+        # Pull vectors that are not in memory from the database
+        missing = [key for key, content_hash in zip(keys, hashes)
+                   if key in job_ids and not self._is_fresh(key, content_hash)]
+        if missing:
+            await self._load(missing)
+
+        vectors, computed = await self._ensure_async(keys, texts, hashes, job_ids)
+        computed = [key for key in computed if key in job_ids]
+        if computed:
+            await self._persist(computed)
+        self._index(computed + [key for key in job_ids if key not in self.index])
+
+        return np.vstack([vectors[key] for key in keys])
+
+    async def get_vectors(self, job_ids: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Stored vectors for catalog jobs by ID, without needing their text (missing IDs are omitted).
+        Vectors in memory are checked against the stored content hash, so jobs re-embedded
+        by another process are reloaded instead of scored with a stale vector.
+        """
+        try:
+            stored = await self.repository.get_hashes(job_ids)
+        except Exception as e:
+            logger.warning(f"Could not check job embeddings, using vectors in memory: {e}")
+            stored = {}
+
+        stale = [job_id for job_id, content_hash in stored.items() if not self._is_fresh(job_id, content_hash)]
+        if stale:
+            await self._load(stale)
+        return {job_id: self._vectors[job_id][1] for job_id in job_ids if job_id in self._vectors}
+
+
+    def get_embeddings_local(self, keys: Sequence[Optional[str]], texts: List[str]) -> np.ndarray:
+        """Get embeddings using only the bounded local tier, for synchronous callers"""
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        hashes = [self.content_hash(text) for text in texts]
+        keys = [key or content_hash for key, content_hash in zip(keys, hashes)]
+        vectors, _ = self._ensure(keys, texts, hashes, set())
+
+        return np.vstack([vectors[key] for key in keys])
+
+    async def upsert_jobs(self, jobs: List[JobListing]) -> int:
+        """Embed and persist jobs whose text changed since they were last stored"""
+        jobs = [job for job in jobs if job.id]
+        if not jobs:
+            return 0
+
+        texts = [self.job_text(job) for job in jobs]
+        hashes = [self.content_hash(text) for text in texts]
+        keys = [job.id for job in jobs]
+
+        await self._load(keys)
+        _, computed = await self._ensure_async(keys, texts, hashes, set(keys))
+        if computed:
+            await self._persist(computed)
+        self._index(computed + [key for key in keys if key not in self.index])
+
+        return len(computed)
+
+    async def remove_jobs(self, job_ids: List[str]) -> int:
+        """Drop vectors for deleted jobs from memory, the index and the database"""
+        for job_id in job_ids:
+            self._vectors.pop(job_id, None)
+        self.index.remove(job_ids)
+
+        try:
+            return await self.repository.delete_many(job_ids)
+        except Exception as e:
+            logger.warning(f"Could not delete job embeddings: {e}")
+            return 0
+
+    async def search(self, query_vector: np.ndarray, k: int = 100) -> List[Tuple[str, float]]:
+        """Return the top-k candidate job IDs for a query embedding"""
+        await self.load_index()
+        return self.index.search(query_vector, k=k)
+
+    async def load_index(self):
+        """
+        Populate the ANN index from persisted embeddings on first use, then pick up
+        embeddings written since the last load at most every VECTOR_INDEX_REFRESH_SECONDS.
+        A failed load is retried on a later call instead of leaving the index partial.
+        """
+        if self._index_loaded and time.monotonic() - self._index_checked_at < self.index_refresh_interval:
+            return
+
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+
+        async with self._index_lock:
+            if self._index_loaded and time.monotonic() - self._index_checked_at < self.index_refresh_interval:
+                return
+
+            # Re-read a short overlap so writes from hosts with slightly skewed clocks are not missed
+            since = self._index_watermark - timedelta(seconds=60) if self._index_watermark else None
+            watermark = self._index_watermark
+            try:
+                added = 0
+                batch_ids, batch_vectors = [], []
+                async for record in self.repository.iter_all(updated_since=since):
+                    updated_at = record.get("updated_at")
+                    if updated_at and (watermark is None or updated_at > watermark):
+                        watermark = updated_at
+
+                    job_id = record["job_id"]
+                    if job_id in self.index and self._is_fresh(job_id, record["content_hash"]):
+                        continue
+                    vector = np.frombuffer(record["vector"], dtype=np.float32)
+                    self._vectors[job_id] = (record["content_hash"], vector)
+                    batch_ids.append(job_id)
+                    batch_vectors.append(vector)
+
+                    if len(batch_ids) >= 1000:
+                        self.index.add(batch_ids, np.vstack(batch_vectors))
+                        added += len(batch_ids)
+                        batch_ids, batch_vectors = [], []
+
+                if batch_ids:
+                    self.index.add(batch_ids, np.vstack(batch_vectors))
+                    added += len(batch_ids)
+            except Exception as e:
+                # Vectors added before the failure stay; the watermark only moves on success
+                logger.warning(f"Could not {'refresh' if self._index_loaded else 'load'} vector index: {e}")
+                return
+
+            if self._index_loaded:
+                if added:
+                    logger.info(f"Refreshed {added} job embeddings in the vector index")
+            else:
+                logger.info(f"Loaded {len(self.index)} job embeddings into the vector index")
+            self._index_watermark = watermark
+            self._index_loaded = True
+            self._index_checked_at = time.monotonic()
+
+    def _index(self, job_ids: List[str]):
+        """Add or refresh catalog job vectors in the ANN index"""
+        job_ids = list(dict.fromkeys(job_ids))
+        if job_ids:
+            self.index.add(job_ids, np.vstack([self._vectors[job_id][1] for job_id in job_ids]))
+
+    def _is_fresh(self, key: str, content_hash: str) -> bool:
+        stored = self._vectors.get(key)
+        return stored is not None and stored[0] == content_hash
+
+    def _ensure(self, keys: List[str], texts: List[str], hashes: List[str],
+                catalog: Set[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """
+        Encode every stale or missing vector in one batch.
+
+        Args:
+            catalog: Keys that are catalog job IDs; the others go to the local tier
+
+        Returns:
+            (vector by key, keys that were computed)
+        """
+        vectors, stale = self._lookup(keys, texts, hashes, catalog)
+        if not stale:
+            return vectors, []
+        return vectors, self._store(stale, self.model.encode([text for text, _ in stale.values()]), catalog, vectors)
+
+    async def _ensure_async(self, keys: List[str], texts: List[str], hashes: List[str],
+                            catalog: Set[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Like _ensure, but encodes on the CPU executor instead of the event loop"""
+        vectors, stale = self._lookup(keys, texts, hashes, catalog)
+        if not stale:
+            return vectors, []
+        encoded = await run_cpu(encode_texts, [text for text, _ in stale.values()])
+        return vectors, self._store(stale, encoded, catalog, vectors)
+
+    def _lookup(self, keys: List[str], texts: List[str], hashes: List[str],
+                catalog: Set[str]) -> Tuple[Dict[str, np.ndarray], Dict[str, Tuple[str, str]]]:
+        """Fresh vectors in memory by key, and the keys whose vector is missing or out of date with their text and hash"""
+        vectors, stale = {}, {}
+        for key, text, content_hash in zip(keys, texts, hashes):
+            stored = self._vectors.get(key) if key in catalog else self._local.get(key)
+            if stored is not None and stored[0] == content_hash:
+                vectors[key] = stored[1]
+            else:
+                stale[key] = (text, content_hash)
+        return vectors, stale
+
+    def _store(self, stale: Dict[str, Tuple[str, str]], encoded, catalog: Set[str],
+               vectors: Dict[str, np.ndarray]) -> List[str]:
+        for key, vector in zip(stale, encoded):
+            vector = np.asarray(vector, dtype=np.float32)
+            if key in catalog:
+                self._vectors[key] = (stale[key][1], vector)
+            else:
+                self._local.set(key, (stale[key][1], vector))
+            vectors[key] = vector
+
+        logger.info(f"Computed {len(stale)} job embeddings")
+        return list(stale)
+
+    async def _load(self, keys: List[str]):
+        """Load persisted vectors into memory"""
+        try:
+            records = await self.repository.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Could not load job embeddings: {e}")
+            return
+
+        for key, record in records.items():
+            vector = np.frombuffer(record["vector"], dtype=np.float32)
+            self._vectors[key] = (record["content_hash"], vector)
+
+    async def _persist(self, keys: List[str]):
+        """Write vectors to the database"""
+        records = []
+        for key in keys:
+            content_hash, vector = self._vectors[key]
+            records.append({
+                "job_id": key,
+                "content_hash": content_hash,
+                "dim": int(vector.shape[0]),
+                "vector": vector.tobytes()
+            })
+
+        try:
+            await self.repository.upsert_many(records)
+        except Exception as e:
+            logger.warning(f"Could not store job embeddings: {e}")
+
+_store: Optional[JobEmbeddingStore] = None
+
+def get_job_embedding_store() -> JobEmbeddingStore:
+    """Get the process-wide job embedding store"""
+    global _store
+    if _store is None:
+        _store = JobEmbeddingStore()
+    return _store
@@ -0,0 +1,120 @@
+"""
+Background job ingestion
+Polls the configured job APIs on a schedule and upserts the results into
+MongoDB, so the catalog stays fresh without request handlers writing to it
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+from app.repositories.job_repository import JobRepository
+from app.services.real_job_scraper import RealJobScraper
+
+logger = logging.getLogger(__name__)
+
+def _env_list(name: str, default: str) -> List[str]:
+    return [item.strip() for item in os.getenv(name, default).split(",") if item.strip()]
+
+class JobIngestionWorker:
+    def __init__(self,
+                 scraper: Optional[RealJobScraper] = None,
+                 repository: Optional[JobRepository] = None):
+        self.scraper = scraper or RealJobScraper()
+        self.repository = repository or JobRepository()
+
+        self.enabled = os.getenv("JOB_INGESTION_ENABLED", "false").lower() == "true"
+        self.interval = float(os.getenv("JOB_INGESTION_INTERVAL", "3600"))
+        self.sources = _env_list("JOB_INGESTION_SOURCES", "jsearch,adzuna")
+        self.queries = _env_list("JOB_INGESTION_QUERIES", "software developer")
+        self.location = os.getenv("JOB_INGESTION_LOCATION", "United States")
+        self.num_pages = int(os.getenv("JOB_INGESTION_PAGES", "2"))
+
+        self.runs: Deque[Dict[str, Any]] = deque(maxlen=20)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start polling in the background (no-op unless JOB_INGESTION_ENABLED is true)"""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Job ingestion started: sources={self.sources}, queries={self.queries}, "
+                    f"every {self.interval:.0f}s")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Job ingestion stopped")
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Job ingestion run failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> Dict[str, Any]:
+        """Fetch every source/query pair and upsert the results"""
+        start = time.perf_counter()
+        run = {
+            "started_at": datetime.now().isoformat(),
+            "fetched": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "errors": 0
+        }
+
+        for source in self.sources:
+            for query in self.queries:
+                try:
+                    jobs = await self.scraper.fetch_source(source, query, self.location, self.num_pages)
+                    run["fetched"] += len(jobs)
+                    if not jobs:
+                        continue
+
+                    counts = await self.repository.upsert_many(jobs)
+                    for key in ("inserted", "updated", "unchanged", "errors"):
+                        run[key] += counts[key]
+                except Exception as e:
+                    run["errors"] += 1
+                    logger.error(f"Error ingesting '{query}' from {source}: {e}")
+
+        run["duration_seconds"] = round(time.perf_counter() - start, 3)
+        run["jobs_per_second"] = round(run["fetched"] / run["duration_seconds"], 1) if run["duration_seconds"] else 0.0
+        self.runs.append(run)
+
+        logger.info(f"Job ingestion run: {run}")
+        return run
+
+    def stats(self) -> Dict[str, Any]:
+        """Schedule and recent run throughput"""
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval,
+            "last_run": self.runs[-1] if self.runs else None,
+            "recent_runs": len(self.runs),
+            "totals": {
+                key: sum(run[key] for run in self.runs)
+                for key in ("fetched", "inserted", "updated", "unchanged", "errors")
+            }
+        }
+
+_worker: Optional[JobIngestionWorker] = None
+
+def get_ingestion_worker() -> JobIngestionWorker:
+    """Get the process-wide ingestion worker"""
+    global _worker
+    if _worker is None:
+        _worker = JobIngestionWorker()
+    return _worker
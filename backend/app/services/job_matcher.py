@@ -1,16 +1,36 @@
 from typing import List, Dict, Tuple
+import hashlib
+import os
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
-import spacy
 from collections import Counter
+from app.services.embedding_store import get_job_embedding_store
+from app.services.model_registry import get_sentence_transformer, get_spacy_nlp
+from app.services.skill_extractor import get_skill_extractor
+from app.utils.cache import LRUCache
+from app.utils.nlp import NOUN_CHUNK_COMPONENTS, ENTITY_COMPONENTS, pipe_texts
+
+# Skill extraction reads noun chunks and entities only
+SKILL_COMPONENTS = tuple(dict.fromkeys(NOUN_CHUNK_COMPONENTS + ENTITY_COMPONENTS))
 
 class JobMatcher:
     def __init__(self):
-        # Initialize sentence transformer model
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
-        # Load spaCy for skill extraction
-        self.nlp = spacy.load("en_core_web_lg")
+        # Job embeddings are cached per job in the shared store
+        self.embedding_store = get_job_embedding_store()
+        # Shared taxonomy used to normalize skill names on both sides
+        self.skill_extractor = get_skill_extractor()
+        # Job skills keyed by description hash, so spaCy runs once per description
+        self.skill_cache = LRUCache(max_entries=int(os.getenv("JOB_SKILL_CACHE_SIZE", "10000")))
+    
+    @property
+    def model(self):
+        """Shared sentence transformer, loaded on first use"""
+        return get_sentence_transformer()
+    
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline for skill extraction, loaded on first use"""
+        return get_spacy_nlp()
         
     def match_jobs(self, resume_data: Dict, jobs: List[Dict], top_k: int = 10) -> List[Dict]:
         """
@@ -25,25 +45,26 @@ class JobMatcher:
             List of job matches with scores and matched skills
         """
         # Extract skills from resume
-        resume_skills = set(resume_data['skills'])
+        resume_skills = self.normalize_skills(resume_data['skills'])
         
         # Prepare resume text for embedding
         resume_text = self._prepare_resume_text(resume_data)
         resume_embedding = self.model.encode([resume_text])[0]
         
-        # Prepare job texts and get embeddings
+        # Prepare job texts and get embeddings, reusing vectors for unchanged jobs
         job_texts = [self._prepare_job_text(job) for job in jobs]
-        job_embeddings = self.model.encode(job_texts)
+        job_keys = [job.get('id') or job.get('url') for job in jobs]
+        job_embeddings = self.embedding_store.get_embeddings_local(job_keys, job_texts)
         
         # Calculate similarity scores
         similarities = cosine_similarity([resume_embedding], job_embeddings)[0]
         
+        # Extract skills from all job descriptions in one batch
+        all_job_skills = self.get_jobs_skills(jobs)
+        
         # Get matched jobs with scores
         job_matches = []
-        for idx, (job, similarity) in enumerate(zip(jobs, similarities)):
-            # Extract skills from job description
-            job_skills = self._extract_skills_from_text(job['description'])
-            
+        for idx, (job, similarity, job_skills) in enumerate(zip(jobs, similarities, all_job_skills)):
             # Calculate skill overlap
             skill_overlap = resume_skills.intersection(job_skills)
             skill_overlap_score = len(skill_overlap) / len(job_skills) if job_skills else 0
@@ -116,20 +137,64 @@ class JobMatcher:
             
         return " ".join(sections)
     
-    def _extract_skills_from_text(self, text: str) -> set:
-        """Extract skills from text using spaCy NER and noun chunks."""
-        doc = self.nlp(text)
-        skills = set()
+    def normalize_skills(self, skills: List[str]) -> set:
+        """Map skill names to their canonical taxonomy names."""
+        return {self.skill_extractor.normalize(skill) for skill in skills}
+    
+    def get_jobs_skills(self, jobs: List[Dict]) -> List[set]:
+        """
+        Get the skills of many jobs.
+        
+        Cached skill sets are reused; the remaining distinct
+        descriptions go through spaCy together via nlp.pipe.
+        
+        Args:
+            jobs: List of job dictionaries
+            
+        Returns:
+            One skill set per job, in the same order
+        """
+        hashes = [self._description_hash(job['description']) for job in jobs]
+        results = [None] * len(jobs)
+        pending = {}
+        
+        for idx, (job, content_hash) in enumerate(zip(jobs, hashes)):
+            skills = self.skill_cache.get(content_hash)
+            if skills is None:
+                pending.setdefault(content_hash, job['description'])
+            else:
+                results[idx] = skills
+        
+        if pending:
+            texts = list(pending.values())
+            docs = pipe_texts(self.nlp, texts, SKILL_COMPONENTS)
+            computed = {}
+            for content_hash, text, doc in zip(pending, texts, docs):
+                computed[content_hash] = frozenset(self._skills_from_doc(text, doc))
+                self.skill_cache.set(content_hash, computed[content_hash])
+            
+            for idx, content_hash in enumerate(hashes):
+                if results[idx] is None:
+                    results[idx] = computed[content_hash]
+        
+        return [set(skills) for skills in results]
+    
+    def _description_hash(self, description: str) -> str:
+        return hashlib.sha256(description.encode('utf-8')).hexdigest()
+    
+    def _skills_from_doc(self, text: str, doc) -> set:
+        """Collect taxonomy skills plus noun chunk and entity candidates from a processed doc."""
+        skills = set(self.skill_extractor.extract(text))
         
         # Extract noun phrases that might be skills
         for chunk in doc.noun_chunks:
             if len(chunk.text.split()) <= 3:  # Skills are usually 1-3 words
-                skills.add(chunk.text.lower())
+                skills.add(self.skill_extractor.normalize(chunk.text))
         
         # Extract named entities that might be skills
         for ent in doc.ents:
             if ent.label_ in ['PRODUCT', 'ORG', 'WORK_OF_ART']:
-                skills.add(ent.text.lower())
+                skills.add(self.skill_extractor.normalize(ent.text))
         
         return skills
     
@@ -1,11 +1,52 @@
-from typing import List, Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from typing import Any, Callable, List, Dict, Iterator, Optional
 import json
+import logging
 import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 import time
 from urllib.parse import urljoin
+from app.utils.html_parser import CardExtractor, CardLayout, get_parser_backend
+from app.utils.http_cache import get_http_cache
+
+logger = logging.getLogger(__name__)
+
+# Card layouts of the scraped job boards
+INDEED_LAYOUT = CardLayout(
+    card='div.job_seen_beacon',
+    text={
+        'title': 'h2.jobTitle',
+        'company': 'span.companyName',
+        'location': 'div.companyLocation',
+        'description': 'div.job-snippet'
+    },
+    href={'url': 'h2.jobTitle a'}
+)
+
+REMOTEOK_LAYOUT = CardLayout(
+    card='tr.job',
+    text={
+        'title': 'h2[itemprop="title"]',
+        'company': 'h3[itemprop="name"]',
+        'description': 'td.description'
+    },
+    href={'url': 'a.preventLink'}
+)
+
+# Shared by all scrapers so concurrent requests don't each spin up threads
+_source_pool: Optional[ThreadPoolExecutor] = None
+_source_pool_lock = threading.Lock()
+
+def _get_source_pool() -> ThreadPoolExecutor:
+    global _source_pool
+    with _source_pool_lock:
+        if _source_pool is None:
+            _source_pool = ThreadPoolExecutor(
+                max_workers=int(os.getenv('JOB_SCRAPER_WORKERS', '8')),
+                thread_name_prefix='job-source'
+            )
+        return _source_pool
 
 class JobScraper:
     def __init__(self):
@@ -16,6 +57,22 @@ class JobScraper:
         # Load API keys from environment variables
         self.rapidapi_key = os.getenv('RAPIDAPI_KEY')
         
+        # Pages are reused while fresh and revalidated with ETag/Last-Modified after
+        self.http_cache = get_http_cache()
+        
+        # Selectors are compiled once for the fastest installed HTML parser
+        backend = get_parser_backend()
+        self._indeed_cards = CardExtractor(INDEED_LAYOUT, backend)
+        self._remoteok_cards = CardExtractor(REMOTEOK_LAYOUT, backend)
+        
+        # Seconds allowed per source, and for a whole get_jobs call
+        self.source_timeout = float(os.getenv('JOB_SOURCE_TIMEOUT', '10'))
+        self.deadline = float(os.getenv('JOB_SCRAPE_DEADLINE', '15'))
+        
+        # source -> latency and error counters
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+        
     def get_jobs(self, 
                  sources: List[str] = ['linkedin', 'indeed', 'remoteok'],
                  keywords: Optional[List[str]] = None,
@@ -25,7 +82,7 @@ class JobScraper:
         Fetch jobs from specified sources.
         
         Args:
-            sources: List of sources to fetch from ('linkedin', 'indeed', 'remoteok')
+            sources: List of sources to fetch from ('linkedin', 'indeed', 'remoteok', 'rapidapi', 'mock')
             keywords: List of job keywords to search for
             location: Location to search in
             max_jobs: Maximum number of jobs to return
@@ -33,32 +90,132 @@ class JobScraper:
         Returns:
             List of job dictionaries
         """
-        all_jobs = []
+        return list(self.iter_jobs(sources, keywords, location, max_jobs))
+    
+    def iter_jobs(self,
+                  sources: List[str] = ['linkedin', 'indeed', 'remoteok'],
+                  keywords: Optional[List[str]] = None,
+                  location: Optional[str] = None,
+                  max_jobs: int = 50,
+                  source_timeout: Optional[float] = None,
+                  deadline: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Query all sources concurrently and yield jobs as each source finishes.
         
-        for source in sources:
-            try:
-                if source == 'linkedin':
-                    jobs = self._scrape_linkedin(keywords, location)
-                elif source == 'indeed':
-                    jobs = self._scrape_indeed(keywords, location)
-                elif source == 'remoteok':
-                    jobs = self._scrape_remoteok(keywords)
-                elif source == 'rapidapi':
-                    jobs = self._fetch_from_rapidapi(keywords, location)
-                else:
-                    continue
-                    
-                all_jobs.extend(jobs)
+        Args:
+            sources: List of sources to fetch from
+            keywords: List of job keywords to search for
+            location: Location to search in
+            max_jobs: Stop once this many jobs have been yielded
+            source_timeout: Seconds to wait for any one source
+            deadline: Seconds to wait for all sources together
+            
+        Yields:
+            Job dictionaries, in the order their sources complete
+        """
+        fetchers = self._source_fetchers(keywords, location, max_jobs)
+        source_timeout = source_timeout or self.source_timeout
+        started = time.monotonic()
+        deadline_at = started + (deadline or self.deadline)
+        
+        pending: Dict[Future, str] = {}
+        for source in dict.fromkeys(sources):
+            if source in fetchers:
+                pending[_get_source_pool().submit(self._timed_fetch, source, fetchers[source])] = source
+        
+        expires_at = {future: min(started + source_timeout, deadline_at) for future in pending}
+        yielded = 0
+        
+        try:
+            while pending and yielded < max_jobs:
+                now = time.monotonic()
                 
-                # Break if we have enough jobs
-                if len(all_jobs) >= max_jobs:
+                # Give up on sources past their timeout or the global deadline
+                for future in [f for f in pending if expires_at[f] <= now]:
+                    source = pending.pop(future)
+                    future.cancel()
+                    self._record_timeout(source)
+                    logger.warning(f"Job source {source} timed out")
+                if not pending:
                     break
-                    
-            except Exception as e:
-                print(f"Error fetching from {source}: {str(e)}")
-                continue
                 
-        return all_jobs[:max_jobs]
+                done, _ = wait(list(pending), timeout=min(expires_at[f] for f in pending) - now,
+                               return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    source = pending.pop(future)
+                    try:
+                        jobs = future.result()
+                    except Exception as e:
+                        logger.error(f"Error fetching from {source}: {e}")
+                        continue
+                    
+                    for job in jobs[:max_jobs - yielded]:
+                        yield job
+                        yielded += 1
+                    if yielded >= max_jobs:
+                        break
+        finally:
+            # Stopped early: don't start sources that are still queued
+            for future in pending:
+                future.cancel()
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source request counts, errors and latency"""
+        with self._stats_lock:
+            return {
+                source: {
+                    **counters,
+                    'total_latency_ms': round(counters['total_latency_ms'], 1),
+                    'avg_latency_ms': round(counters['total_latency_ms'] / counters['requests'], 1)
+                    if counters['requests'] else 0.0
+                }
+                for source, counters in self._stats.items()
+            }
+    
+    def _source_fetchers(self,
+                         keywords: Optional[List[str]],
+                         location: Optional[str],
+                         max_jobs: int) -> Dict[str, Callable[[], List[Dict]]]:
+        return {
+            'linkedin': lambda: self._scrape_linkedin(keywords, location),
+            'indeed': lambda: self._scrape_indeed(keywords, location),
+            'remoteok': lambda: self._scrape_remoteok(keywords),
+            'rapidapi': lambda: self._fetch_from_rapidapi(keywords, location),
+            'mock': lambda: self.get_mock_jobs(max_jobs)
+        }
+    
+    def _timed_fetch(self, source: str, fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        """Run one source fetch, recording its latency and outcome"""
+        start = time.monotonic()
+        try:
+            jobs = fetch()
+        except Exception as e:
+            self._record(source, time.monotonic() - start, error=type(e).__name__)
+            raise
+        self._record(source, time.monotonic() - start, jobs=len(jobs))
+        return jobs
+    
+    def _counters(self, source: str) -> Dict[str, float]:
+        return self._stats.setdefault(source, {
+            'requests': 0, 'jobs': 0, 'errors': 0, 'timeouts': 0,
+            'total_latency_ms': 0.0, 'last_latency_ms': 0.0
+        })
+    
+    def _record(self, source: str, latency: float, jobs: int = 0, error: Optional[str] = None):
+        with self._stats_lock:
+            counters = self._counters(source)
+            counters['requests'] += 1
+            counters['jobs'] += jobs
+            if error:
+                counters['errors'] += 1
+            counters['total_latency_ms'] += latency * 1000
+            counters['last_latency_ms'] = round(latency * 1000, 1)
+    
+    def _record_timeout(self, source: str):
+        # The fetch itself is recorded when (if) its thread finishes
+        with self._stats_lock:
+            self._counters(source)['timeouts'] += 1
     
     def _scrape_linkedin(self, keywords: Optional[List[str]], location: Optional[str]) -> List[Dict]:
         """Scrape jobs from LinkedIn."""
@@ -78,39 +235,27 @@ class JobScraper:
             'sort': 'date'
         }
         
+        # Request failures propagate so the aggregator can count them
+        response = self.http_cache.get(base_url, params=params, headers=self.headers, timeout=self.source_timeout)
+        response.raise_for_status()
+        
         try:
-            response = requests.get(base_url, params=params, headers=self.headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find job cards
-            job_cards = soup.find_all('div', class_='job_seen_beacon')
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h2', class_='jobTitle')
-                    company_elem = card.find('span', class_='companyName')
-                    location_elem = card.find('div', class_='companyLocation')
-                    description_elem = card.find('div', class_='job-snippet')
-                    
-                    if not all([title_elem, company_elem, location_elem]):
-                        continue
-                        
-                    job = {
-                        'title': title_elem.text.strip(),
-                        'company': company_elem.text.strip(),
-                        'location': location_elem.text.strip(),
-                        'description': description_elem.text.strip() if description_elem else '',
-                        'source': 'indeed',
-                        'url': urljoin(base_url, title_elem.find('a')['href']),
-                        'posted_date': datetime.now().isoformat()  # Indeed doesn't show exact dates
-                    }
-                    
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    print(f"Error parsing Indeed job card: {str(e)}")
+            for card in self._indeed_cards.extract(response.text):
+                if not all([card['title'], card['company'], card['location'], card['url']]):
                     continue
                     
+                job = {
+                    'title': card['title'],
+                    'company': card['company'],
+                    'location': card['location'],
+                    'description': card['description'] or '',
+                    'source': 'indeed',
+                    'url': urljoin(base_url, card['url']),
+                    'posted_date': datetime.now().isoformat()  # Indeed doesn't show exact dates
+                }
+                
+                jobs.append(job)
+                    
         except Exception as e:
             print(f"Error scraping Indeed: {str(e)}")
             
@@ -121,43 +266,31 @@ class JobScraper:
         jobs = []
         base_url = "https://remoteok.com/remote-dev-jobs"
         
+        response = self.http_cache.get(base_url, headers=self.headers, timeout=self.source_timeout)
+        response.raise_for_status()
+        
         try:
-            response = requests.get(base_url, headers=self.headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find job listings
-            job_listings = soup.find_all('tr', class_='job')
-            
-            for listing in job_listings:
-                try:
-                    title_elem = listing.find('h2', itemprop='title')
-                    company_elem = listing.find('h3', itemprop='name')
-                    description_elem = listing.find('td', class_='description')
+            for card in self._remoteok_cards.extract(response.text):
+                if not all([card['title'], card['company'], card['description'], card['url']]):
+                    continue
                     
-                    if not all([title_elem, company_elem, description_elem]):
+                # Check if job matches keywords
+                if keywords:
+                    job_text = f"{card['title']} {card['company']} {card['description']}".lower()
+                    if not any(keyword.lower() in job_text for keyword in keywords):
                         continue
-                        
-                    # Check if job matches keywords
-                    if keywords:
-                        job_text = f"{title_elem.text} {company_elem.text} {description_elem.text}".lower()
-                        if not any(keyword.lower() in job_text for keyword in keywords):
-                            continue
-                    
-                    job = {
-                        'title': title_elem.text.strip(),
-                        'company': company_elem.text.strip(),
-                        'location': 'Remote',
-                        'description': description_elem.text.strip(),
-                        'source': 'remoteok',
-                        'url': urljoin(base_url, listing.find('a', class_='preventLink')['href']),
-                        'posted_date': datetime.now().isoformat()
-                    }
-                    
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    print(f"Error parsing RemoteOK job listing: {str(e)}")
-                    continue
+                
+                job = {
+                    'title': card['title'],
+                    'company': card['company'],
+                    'location': 'Remote',
+                    'description': card['description'],
+                    'source': 'remoteok',
+                    'url': urljoin(base_url, card['url']),
+                    'posted_date': datetime.now().isoformat()
+                }
+                
+                jobs.append(job)
                     
         except Exception as e:
             print(f"Error scraping RemoteOK: {str(e)}")
@@ -177,15 +310,17 @@ class JobScraper:
             'X-RapidAPI-Host': 'jsearch.p.rapidapi.com'
         }
         
+        params = {
+            'query': ' '.join(keywords) if keywords else 'software engineer',
+            'location': location if location else '',
+            'page': '1',
+            'num_pages': '1'
+        }
+        
+        response = self.http_cache.get(url, params=params, headers=headers, timeout=self.source_timeout)
+        response.raise_for_status()
+        
         try:
-            params = {
-                'query': ' '.join(keywords) if keywords else 'software engineer',
-                'location': location if location else '',
-                'page': '1',
-                'num_pages': '1'
-            }
-            
-            response = requests.get(url, headers=headers, params=params)
             data = response.json()
             
             if 'data' in data:
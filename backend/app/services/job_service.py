@@ -1,16 +1,73 @@
 import requests
 from bs4 import BeautifulSoup
 import json
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple, Union
 import os
 import logging
+import threading
 from datetime import datetime
-from app.models.job import JobListing, JobSkill
+from app.models.job import JobListing, JobSkill, JobSummary
 from app.repositories.job_repository import JobRepository
+from app.repositories.pagination import InvalidCursorError, KeysetIndex
 from app.services.real_job_scraper import RealJobScraper
 
 logger = logging.getLogger(__name__)
 
+class MockJobCatalog:
+    """Mock jobs parsed once into JobListing objects, reloaded when the file's mtime changes"""
+
+    def __init__(self, path: str, load: Callable[[], List[JobListing]]):
+        """
+        Args:
+            path: Mock data file whose mtime is watched
+            load: Reads (creating if needed) and parses the file
+        """
+        self.path = path
+        self._load = load
+        self._mtime: Optional[int] = None
+        self.jobs: List[JobListing] = []
+        self.by_id: Dict[str, JobListing] = {}
+        # Same (posted_date, id) ordering as database keyset pages
+        self.pages = KeysetIndex([], lambda job: job.posted_date, lambda job: job.id or "")
+        self._lock = threading.Lock()
+
+    def _current_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh(self) -> "MockJobCatalog":
+        """Reload the catalog if the file is new or has changed"""
+        if self._mtime is not None and self._current_mtime() == self._mtime:
+            return self
+
+        with self._lock:
+            mtime = self._current_mtime()
+            if self._mtime is not None and mtime == self._mtime:
+                return self
+
+            jobs = self._load()
+            self.by_id = {job.id: job for job in jobs if job.id}
+            self.pages = KeysetIndex(jobs, lambda job: job.posted_date, lambda job: job.id or "")
+            # Offset pages use the same newest-first order as cursor pages
+            self.jobs = self.pages.items
+            # The loader may have just created the file
+            self._mtime = mtime if mtime is not None else self._current_mtime()
+            logger.info(f"Loaded {len(jobs)} mock jobs from {self.path}")
+
+        return self
+
+_mock_catalogs: Dict[str, MockJobCatalog] = {}
+
+def get_mock_catalog(path: str, load: Callable[[], List[JobListing]]) -> MockJobCatalog:
+    """Get the process-wide catalog for a mock data file, refreshed if it changed"""
+    path = os.path.realpath(path)
+    catalog = _mock_catalogs.get(path)
+    if catalog is None:
+        catalog = _mock_catalogs.setdefault(path, MockJobCatalog(path, load))
+    return catalog.refresh()
+
 class JobService:
     def __init__(self):
         self.mock_data_path = os.path.join(os.path.dirname(__file__), "../data/mock_jobs.json")
@@ -18,11 +75,14 @@ class JobService:
         self.real_job_scraper = RealJobScraper()
         self.use_real_api = os.getenv("USE_REAL_JOB_API", "false").lower() == "true"
         
-    async def get_job_listings(self, limit: int = 50, offset: int = 0) -> List[JobListing]:
-        """Get job listings from database, real API, or mock data"""
+    async def get_job_listings(self,
+                               limit: int = 50,
+                               offset: int = 0,
+                               summary: bool = False) -> List[Union[JobListing, JobSummary]]:
+        """Get job listings from database, real API, or mock data (as summaries if summary is True)"""
         # Try to get from database first
         try:
-            db_jobs = await self.job_repository.list_all(skip=offset, limit=limit)
+            db_jobs = await self.job_repository.list_all(skip=offset, limit=limit, summary=summary)
             if db_jobs:
                 logger.info(f"Retrieved {len(db_jobs)} jobs from database")
                 return db_jobs
@@ -39,52 +99,54 @@ class JobService:
                     num_pages=2
                 )
                 
+                # Not stored here: the ingestion worker keeps the database up to date
                 if api_jobs:
-                    # Try to store in database for future use
-                    try:
-                        await self.job_repository.create_many(api_jobs)
-                        logger.info(f"Stored {len(api_jobs)} jobs in database")
-                    except Exception as db_error:
-                        logger.warning(f"Could not store jobs in database: {db_error}")
-                    
-                    return api_jobs[offset:offset+limit]
+                    return self._view(api_jobs[offset:offset+limit], summary)
             except Exception as e:
                 logger.error(f"Error fetching from real API: {e}")
         
         # Fallback to mock data
         logger.info("Using mock job data")
-        jobs = self._load_mock_data()
+        jobs = self._mock_catalog().jobs
         
         # Apply pagination
-        paginated_jobs = jobs[offset:offset+limit]
+        return self._view(jobs[offset:offset+limit], summary)
+    
+    async def get_job_page(self,
+                           limit: int = 50,
+                           cursor: Optional[str] = None,
+                           summary: bool = False) -> Tuple[List[Union[JobListing, JobSummary]], Optional[str]]:
+        """Get one page of job listings, newest first, and the cursor of the next page"""
+        # Try to get from database first
+        try:
+            db_jobs, next_cursor = await self.job_repository.list_page(limit=limit, cursor=cursor, summary=summary)
+            if db_jobs:
+                logger.info(f"Retrieved {len(db_jobs)} jobs from database")
+                return db_jobs, next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.warning(f"Database unavailable: {e}")
         
-        # Convert to JobListing objects
-        job_listings = []
-        for job in paginated_jobs:
-            skills = [JobSkill(name=skill["name"], 
-                              category=skill.get("category"),
-                              importance=skill.get("importance", 0.5)) 
-                     for skill in job.get("skills", [])]
-            
-            job_listing = JobListing(
-                id=job.get("id"),
-                title=job.get("title", ""),
-                company=job.get("company", ""),
-                location=job.get("location"),
-                remote=job.get("remote", False),
-                description=job.get("description", ""),
-                skills=skills,
-                salary_min=job.get("salary_min"),
-                salary_max=job.get("salary_max"),
-                experience_level=job.get("experience_level"),
-                job_type=job.get("job_type"),
-                url=job.get("url"),
-                posted_date=datetime.fromisoformat(job.get("posted_date")) if job.get("posted_date") else None,
-                source=job.get("source")
-            )
-            job_listings.append(job_listing)
+        # If database is empty and real API is enabled, page through API results
+        if self.use_real_api:
+            try:
+                api_jobs = await self.real_job_scraper.search_jobs(
+                    query="software developer",
+                    location="United States",
+                    num_pages=2
+                )
+                if api_jobs:
+                    jobs, next_cursor = KeysetIndex(api_jobs, lambda job: job.posted_date,
+                                                    lambda job: job.id or "").page(limit, cursor)
+                    return self._view(jobs, summary), next_cursor
+            except Exception as e:
+                logger.error(f"Error fetching from real API: {e}")
         
-        return job_listings
+        # Fallback to mock data, in the same order as database pages
+        logger.info("Using mock job data")
+        jobs, next_cursor = self._mock_catalog().pages.page(limit, cursor)
+        return self._view(jobs, summary), next_cursor
     
     async def get_job_by_id(self, job_id: str) -> Optional[JobListing]:
         """Get a specific job by ID"""
@@ -97,33 +159,65 @@ class JobService:
             logger.warning(f"Database error: {e}")
         
         # Fallback to mock data
-        jobs = self._load_mock_data()
+        return self._mock_catalog().by_id.get(job_id)
+    
+    async def get_jobs_by_ids(self,
+                              job_ids: List[str],
+                              summary: bool = False) -> List[Union[JobListing, JobSummary]]:
+        """Get jobs by ID, preserving the order of the given IDs"""
+        found = {}
         
-        for job in jobs:
-            if job.get("id") == job_id:
-                skills = [JobSkill(name=skill["name"], 
-                                  category=skill.get("category"),
-                                  importance=skill.get("importance", 0.5)) 
-                         for skill in job.get("skills", [])]
-                
-                return JobListing(
-                    id=job.get("id"),
-                    title=job.get("title", ""),
-                    company=job.get("company", ""),
-                    location=job.get("location"),
-                    remote=job.get("remote", False),
-                    description=job.get("description", ""),
-                    skills=skills,
-                    salary_min=job.get("salary_min"),
-                    salary_max=job.get("salary_max"),
-                    experience_level=job.get("experience_level"),
-                    job_type=job.get("job_type"),
-                    url=job.get("url"),
-                    posted_date=datetime.fromisoformat(job.get("posted_date")) if job.get("posted_date") else None,
-                    source=job.get("source")
-                )
+        # Try database first
+        try:
+            for job in await self.job_repository.get_many(job_ids, summary=summary):
+                found[job.id] = job
+        except Exception as e:
+            logger.warning(f"Database error: {e}")
         
-        return None
+        # Fill the rest from mock data
+        if len(found) < len(set(job_ids)):
+            mock_jobs = self._mock_catalog().by_id
+            for job_id in job_ids:
+                if job_id not in found and job_id in mock_jobs:
+                    found[job_id] = JobSummary.from_listing(mock_jobs[job_id]) if summary else mock_jobs[job_id]
+        
+        return [found[job_id] for job_id in job_ids if job_id in found]
+    
+    @staticmethod
+    def _view(jobs: Sequence[JobListing], summary: bool) -> List[Union[JobListing, JobSummary]]:
+        """Full listings, or their summaries"""
+        return [JobSummary.from_listing(job) for job in jobs] if summary else list(jobs)
+    
+    def _to_job_listing(self, job: Dict[str, Any]) -> JobListing:
+        """Convert a mock job dictionary to a JobListing"""
+        skills = [JobSkill(name=skill["name"], 
+                          category=skill.get("category"),
+                          importance=skill.get("importance", 0.5)) 
+                 for skill in job.get("skills", [])]
+        
+        return JobListing(
+            id=job.get("id"),
+            title=job.get("title", ""),
+            company=job.get("company", ""),
+            location=job.get("location"),
+            remote=job.get("remote", False),
+            description=job.get("description", ""),
+            skills=skills,
+            salary_min=job.get("salary_min"),
+            salary_max=job.get("salary_max"),
+            experience_level=job.get("experience_level"),
+            job_type=job.get("job_type"),
+            url=job.get("url"),
+            posted_date=datetime.fromisoformat(job.get("posted_date")) if job.get("posted_date") else None,
+            source=job.get("source")
+        )
+    
+    def _mock_catalog(self) -> MockJobCatalog:
+        """Parsed mock jobs, shared across JobService instances"""
+        return get_mock_catalog(
+            self.mock_data_path,
+            lambda: [self._to_job_listing(job) for job in self._load_mock_data()]
+        )
     
     def _load_mock_data(self) -> List[Dict[str, Any]]:
         """Load mock job data"""
@@ -145,7 +239,7 @@ class JobService:
         with open(self.mock_data_path, "r") as f:
             return json.load(f)
     
-    def _generate_mock_data(self) -> List[Dict[str, Any]]:
+    def _generate_mock_data(self, count: int = 50) -> List[Dict[str, Any]]:
         """Generate mock job data"""
         # Sample job titles and companies
         job_titles = [
@@ -185,9 +279,9 @@ class JobService:
             "Attention to Detail", "Collaboration", "Presentation Skills"
         ]
         
-        # Generate 50 mock jobs
+        # Generate mock jobs (50 by default)
         mock_jobs = []
-        for i in range(1, 51):
+        for i in range(1, count + 1):
             # Select random job title and company
             import random
             title_index = random.randint(0, len(job_titles) - 1)
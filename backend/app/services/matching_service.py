@@ -1,35 +1,60 @@
 from typing import List, Dict, Any
-from sentence_transformers import SentenceTransformer
+import os
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 from app.models.resume import Resume
 from app.models.job import JobListing, JobMatch, JobSkill
 from app.services.job_service import JobService
+from app.services.embedding_store import get_job_embedding_store
+from app.services.model_registry import encode_texts
+from app.utils.executor import run_cpu
 
 class MatchingService:
     def __init__(self):
-        # Load sentence transformer model
-        try:
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
-        except:
-            # If model not found, download it
-            import os
-            os.system("pip install -U sentence-transformers")
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Job embeddings are cached per job in the shared store
+        self.embedding_store = get_job_embedding_store()
 
         self.job_service = JobService()
+        # Number of nearest jobs retrieved from the vector index for re-ranking
+        self.candidate_pool = int(os.getenv("MATCHING_CANDIDATE_POOL", "100"))
 
     async def match_resume_to_jobs(self, resume: Resume, limit: int = 10) -> List[JobMatch]:
         """Match resume to jobs and return top matches"""
-        # Get all job listings
-        job_listings = await self.job_service.get_job_listings(limit=100)
+        # Encode the resume once, off the event loop
+        resume_text = self._get_resume_text(resume)
+        resume_embedding = (await run_cpu(encode_texts, [resume_text]))[0]
+
+        # Retrieve the nearest jobs from the vector index, falling back to the
+        # first page of listings until the index has been populated. Candidates
+        # are scored from summaries; descriptions are only loaded for the results.
+        candidates = await self.embedding_store.search(resume_embedding, k=self.candidate_pool)
+        if candidates:
+            job_summaries = await self.job_service.get_jobs_by_ids(
+                [job_id for job_id, _ in candidates], summary=True)
+        else:
+            job_summaries = await self.job_service.get_job_listings(limit=self.candidate_pool, summary=True)
 
         # Extract resume skills
         resume_skills = [skill.name.lower() for skill in resume.skills]
 
+        # Calculate semantic similarity for all candidates in one batch, using stored
+        # vectors and embedding full listings only for jobs that have none yet
+        vectors = await self.embedding_store.get_vectors([job.id for job in job_summaries if job.id])
+        full_jobs = {}
+        unembedded = [job.id for job in job_summaries if job.id and job.id not in vectors]
+        if unembedded:
+            for job in await self.job_service.get_jobs_by_ids(unembedded):
+                full_jobs[job.id] = job
+            new_vectors = await self.embedding_store.get_embeddings(list(full_jobs.values()))
+            vectors.update(zip(full_jobs, new_vectors))
+
+        scored_jobs = [job for job in job_summaries if job.id in vectors]
+        job_embeddings = np.array([vectors[job.id] for job in scored_jobs])
+        semantic_scores = self._cosine_scores(resume_embedding, job_embeddings)
+
         # Calculate match scores for each job
-        job_matches = []
-        for job in job_listings:
+        scored = []
+        for job, similarity in zip(scored_jobs, semantic_scores):
             # Extract job skills
             job_skills = [skill.name.lower() for skill in job.skills]
 
@@ -43,45 +68,49 @@ class MatchingService:
             else:
                 skill_match_score = 0
 
-            # Calculate semantic similarity between resume and job description
-            resume_text = self._get_resume_text(resume)
-            job_text = job.description
-
-            semantic_score = self._calculate_semantic_similarity(resume_text, job_text) * 100
+            semantic_score = similarity * 100
 
             # Combine scores (70% skill match, 30% semantic match)
             match_score = 0.7 * skill_match_score + 0.3 * semantic_score
 
+            scored.append((round(match_score, 2), job, matched_skills, missing_skills))
+
+        # Sort by match score (descending) and keep the top matches
+        scored.sort(key=lambda x: x[0], reverse=True)
+        scored = scored[:limit]
+
+        # Load full listings for the returned matches only
+        missing_ids = [job.id for _, job, _, _ in scored if job.id not in full_jobs]
+        if missing_ids:
+            for job in await self.job_service.get_jobs_by_ids(missing_ids):
+                full_jobs[job.id] = job
+
+        job_matches = []
+        for match_score, summary, matched_skills, missing_skills in scored:
+            job = full_jobs.get(summary.id)
+            if job is None:
+                continue
+
             # Generate match reasoning
             match_reasoning = self._generate_match_reasoning(
                 resume, job, matched_skills, missing_skills, match_score)
 
             # Create JobMatch object
-            job_match = JobMatch(
+            job_matches.append(JobMatch(
                 job=job,
-                match_score=round(match_score, 2),
+                match_score=match_score,
                 matched_skills=matched_skills,
                 missing_skills=missing_skills,
                 match_reasoning=match_reasoning,
-                best_fit=False  # Will be set later
-            )
-
-            job_matches.append(job_match)
+                best_fit=len(job_matches) < 3  # Mark top matches as "best fit"
+            ))
 
-        # Sort by match score (descending)
-        job_matches.sort(key=lambda x: x.match_score, reverse=True)
-
-        # Mark top matches as "best fit"
-        for i in range(min(3, len(job_matches))):
-            job_matches[i].best_fit = True
-
-        # Return top matches
-        return job_matches[:limit]
+        return job_matches
 
     async def get_resume_improvement_suggestions(self, resume: Resume) -> Dict[str, Any]:
         """Generate suggestions to improve resume for better job matches"""
-        # Get all job listings
-        job_listings = await self.job_service.get_job_listings(limit=100)
+        # Get job summaries (skills only, descriptions are not needed)
+        job_listings = await self.job_service.get_job_listings(limit=100, summary=True)
 
         # Extract resume skills
         resume_skills = [skill.name.lower() for skill in resume.skills]
@@ -177,16 +206,13 @@ class MatchingService:
 
         return text
 
-    def _calculate_semantic_similarity(self, text1: str, text2: str) -> float:
-        """Calculate semantic similarity between two texts"""
-        # Encode texts
-        embedding1 = self.model.encode([text1])[0]
-        embedding2 = self.model.encode([text2])[0]
-
-        # Calculate cosine similarity
-        similarity = cosine_similarity([embedding1], [embedding2])[0][0]
+    def _cosine_scores(self, query_embedding: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
+        """Calculate cosine similarity between one embedding and a batch of embeddings"""
+        if len(embeddings) == 0:
+            return np.zeros(0, dtype=np.float32)
 
-        return similarity
+        # Single matrix-vector product instead of one call per pair
+        return cosine_similarity([query_embedding], embeddings)[0]
 
     def _generate_match_reasoning(self, resume: Resume, job: JobListing,
                                  matched_skills: List[str], missing_skills: List[str],
@@ -0,0 +1,146 @@
+"""
+Process-wide model registry
+Loads each NLP model lazily, exactly once per process, and records how long
+each load took and how much resident memory it added
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SENTENCE_TRANSFORMER = "sentence_transformer"
+SPACY_NLP = "spacy_nlp"
+SKILLNER_EXTRACTOR = "skillner_extractor"
+
+SENTENCE_TRANSFORMER_MODEL = 'all-MiniLM-L6-v2'
+SPACY_MODEL = "en_core_web_lg"
+
+def _current_rss_bytes() -> int:
+    """Current resident set size of this process"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        # Not Linux: fall back to peak RSS (reported in bytes on macOS)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        return 0
+
+class ModelRegistry:
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """Register a loader; the model is built on first get()"""
+        with self._registry_lock:
+            self._loaders[name] = loader
+            self._locks[name] = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        """Get a model, loading it on first use"""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        if name not in self._loaders:
+            raise KeyError(f"Unknown model: {name}")
+
+        with self._locks[name]:
+            # Another thread may have finished loading while we waited
+            if name in self._models:
+                return self._models[name]
+
+            logger.info(f"Loading model '{name}'...")
+            rss_before = _current_rss_bytes()
+            start = time.perf_counter()
+
+            model = self._loaders[name]()
+
+            load_seconds = time.perf_counter() - start
+            rss_after = _current_rss_bytes()
+            self._stats[name] = {
+                "load_seconds": round(load_seconds, 3),
+                "rss_delta_mb": round((rss_after - rss_before) / (1024 * 1024), 1)
+            }
+            self._models[name] = model
+
+            logger.info(f"Loaded model '{name}' in {load_seconds:.2f}s "
+                        f"(+{self._stats[name]['rss_delta_mb']} MB RSS)")
+            return model
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def warm_up(self, names: Optional[List[str]] = None):
+        """Load models ahead of the first request"""
+        for name in names or list(self._loaders):
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.error(f"Failed to warm up model '{name}': {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Load status, load times and memory of registered models"""
+        return {
+            "rss_mb": round(_current_rss_bytes() / (1024 * 1024), 1),
+            "models": {
+                name: {"loaded": self.is_loaded(name), **self._stats.get(name, {})}
+                for name in self._loaders
+            }
+        }
+
+def _load_sentence_transformer():
+    from sentence_transformers import SentenceTransformer
+    try:
+        return SentenceTransformer(SENTENCE_TRANSFORMER_MODEL)
+    except:
+        # If model not found, download it
+        os.system("pip install -U sentence-transformers")
+        return SentenceTransformer(SENTENCE_TRANSFORMER_MODEL)
+
+def _load_spacy():
+    import spacy
+    try:
+        return spacy.load(SPACY_MODEL)
+    except:
+        # If model not found, download it
+        os.system(f"python -m spacy download {SPACY_MODEL}")
+        return spacy.load(SPACY_MODEL)
+
+def _load_skillner():
+    from skillNer.general_params import SKILL_DB
+    from skillNer.skill_extractor_class import SkillExtractor
+    nlp = get_spacy_nlp()
+    return SkillExtractor(nlp, SKILL_DB, PhraseMatcher=nlp.matcher)
+
+registry = ModelRegistry()
+registry.register(SENTENCE_TRANSFORMER, _load_sentence_transformer)
+registry.register(SPACY_NLP, _load_spacy)
+registry.register(SKILLNER_EXTRACTOR, _load_skillner)
+
+def get_sentence_transformer():
+    """Shared SentenceTransformer used for resume and job embeddings"""
+    return registry.get(SENTENCE_TRANSFORMER)
+
+def get_spacy_nlp():
+    """Shared spaCy pipeline"""
+    return registry.get(SPACY_NLP)
+
+def get_skillner_extractor():
+    """Shared skillNer extractor built on the shared spaCy pipeline"""
+    return registry.get(SKILLNER_EXTRACTOR)
+
+def encode_texts(texts: List[str]):
+    """Encode texts with the shared sentence transformer (safe to send to a worker process)"""
+    return get_sentence_transformer().encode(texts)
@@ -2,17 +2,26 @@
 Real Job API Integration Service
 Fetches jobs from multiple sources: RapidAPI (JSearch), Adzuna, and other job boards
 """
+import asyncio
 import os
-import requests
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+from datetime import datetime, timezone
+import httpx
 from app.models.job import JobListing, JobSkill
+from app.services.skill_extractor import get_skill_extractor
+from app.utils.http_cache import get_http_cache
+from app.utils.http_client import get_http_client
+from app.utils.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 class RealJobScraper:
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: HTTP client to use, defaults to the shared pooled client
+        """
         # RapidAPI JSearch credentials
         self.rapidapi_key = os.getenv("RAPIDAPI_KEY", "")
         self.rapidapi_host = "jsearch.p.rapidapi.com"
@@ -21,7 +30,22 @@ class RealJobScraper:
         self.adzuna_app_id = os.getenv("ADZUNA_APP_ID", "")
         self.adzuna_app_key = os.getenv("ADZUNA_APP_KEY", "")
         
+        # Base URLs can point at a local stub server
+        self.jsearch_base_url = os.getenv("JSEARCH_BASE_URL", "https://jsearch.p.rapidapi.com").rstrip("/")
+        self.adzuna_base_url = os.getenv("ADZUNA_BASE_URL", "https://api.adzuna.com").rstrip("/")
+        
         self.use_mock_fallback = os.getenv("USE_MOCK_JOBS", "false").lower() == "true"
+        
+        # Pages fetched concurrently per search; requests per second per host are
+        # limited process-wide, across every scraper instance
+        self.max_concurrency = int(os.getenv("JOB_API_CONCURRENCY", "4"))
+        self.rate_limiter = get_rate_limiter()
+        self._client = client
+        self.http_cache = get_http_cache()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
     
     async def search_jobs(self, 
                          query: str = "software developer",
@@ -58,6 +82,20 @@ class RealJobScraper:
             logger.error(f"Error fetching jobs: {e}")
             return await self._get_mock_jobs()
     
+    async def fetch_source(self,
+                           source: str,
+                           query: str,
+                           location: str,
+                           num_pages: int = 1) -> List[JobListing]:
+        """Fetch jobs from one configured source ('jsearch' or 'adzuna'), without mock fallback"""
+        if source == "jsearch" and self.rapidapi_key:
+            return await self._fetch_from_jsearch(query, location, num_pages, remote_only=False)
+        if source == "adzuna" and self.adzuna_app_id and self.adzuna_app_key:
+            return await self._fetch_from_adzuna(query, location, num_pages)
+        
+        logger.warning(f"Job source '{source}' is unknown or not configured")
+        return []
+    
     async def _fetch_from_jsearch(self, 
                                   query: str, 
                                   location: str, 
@@ -65,16 +103,14 @@ class RealJobScraper:
                                   remote_only: bool) -> List[JobListing]:
         """Fetch jobs from RapidAPI JSearch"""
         try:
-            url = "https://jsearch.p.rapidapi.com/search"
+            url = f"{self.jsearch_base_url}/search"
             
             headers = {
                 "X-RapidAPI-Key": self.rapidapi_key,
                 "X-RapidAPI-Host": self.rapidapi_host
             }
             
-            all_jobs = []
-            
-            for page in range(1, num_pages + 1):
+            async def fetch_page(page: int) -> Optional[List[Dict[str, Any]]]:
                 params = {
                     "query": f"{query} in {location}",
                     "page": str(page),
@@ -85,23 +121,11 @@ class RealJobScraper:
                 if remote_only:
                     params["remote_jobs_only"] = "true"
                 
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    jobs_data = data.get("data", [])
-                    
-                    for job_data in jobs_data:
-                        job = self._parse_jsearch_job(job_data)
-                        if job:
-                            all_jobs.append(job)
-                    
-                    logger.info(f"Fetched {len(jobs_data)} jobs from JSearch (page {page})")
-                else:
-                    logger.error(f"JSearch API error: {response.status_code}")
-                    break
+                data = await self._get_json("JSearch", url, params=params, headers=headers)
+                return data.get("data", []) if data is not None else None
             
-            return all_jobs
+            return self._parse_pages("JSearch", await self._fetch_pages(num_pages, fetch_page),
+                                     self._parse_jsearch_job)
             
         except Exception as e:
             logger.error(f"Error fetching from JSearch: {e}")
@@ -116,11 +140,9 @@ class RealJobScraper:
             # Adzuna uses country codes (e.g., 'us' for United States)
             country = "us"  # Default to US
             
-            url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/{{}}"
+            url = f"{self.adzuna_base_url}/v1/api/jobs/{country}/search/{{}}"
             
-            all_jobs = []
-            
-            for page in range(1, num_pages + 1):
+            async def fetch_page(page: int) -> Optional[List[Dict[str, Any]]]:
                 params = {
                     "app_id": self.adzuna_app_id,
                     "app_key": self.adzuna_app_key,
@@ -130,28 +152,78 @@ class RealJobScraper:
                     "page": page
                 }
                 
-                response = requests.get(url.format(page), params=params, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    jobs_data = data.get("results", [])
-                    
-                    for job_data in jobs_data:
-                        job = self._parse_adzuna_job(job_data)
-                        if job:
-                            all_jobs.append(job)
-                    
-                    logger.info(f"Fetched {len(jobs_data)} jobs from Adzuna (page {page})")
-                else:
-                    logger.error(f"Adzuna API error: {response.status_code}")
-                    break
+                data = await self._get_json("Adzuna", url.format(page), params=params)
+                return data.get("results", []) if data is not None else None
             
-            return all_jobs
+            return self._parse_pages("Adzuna", await self._fetch_pages(num_pages, fetch_page),
+                                     self._parse_adzuna_job)
             
         except Exception as e:
             logger.error(f"Error fetching from Adzuna: {e}")
             return []
     
+    async def _fetch_pages(self,
+                           num_pages: int,
+                           fetch_page: Callable[[int], Awaitable[Optional[List[Dict[str, Any]]]]]
+                           ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Fetch pages 1..num_pages concurrently, at most max_concurrency at a time"""
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        
+        async def bounded(page: int):
+            async with semaphore:
+                return await fetch_page(page)
+        
+        return await asyncio.gather(*(bounded(page) for page in range(1, num_pages + 1)))
+    
+    def _parse_pages(self,
+                     source: str,
+                     pages: List[Optional[List[Dict[str, Any]]]],
+                     parse_job: Callable[[Dict[str, Any]], Optional[JobListing]]) -> List[JobListing]:
+        """Parse fetched pages in order, stopping at the first page that failed"""
+        all_jobs = []
+        
+        for page, jobs_data in enumerate(pages, start=1):
+            if jobs_data is None:
+                break
+            
+            for job_data in jobs_data:
+                job = parse_job(job_data)
+                if job:
+                    all_jobs.append(job)
+            
+            logger.info(f"Fetched {len(jobs_data)} jobs from {source} (page {page})")
+        
+        return all_jobs
+    
+    async def _get_json(self,
+                        source: str,
+                        url: str,
+                        params: Dict[str, Any],
+                        headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """GET a JSON document through the response cache, returning None on any error"""
+        try:
+            # Fresh cache hits are not throttled; the limiter is taken only for network requests
+            response = await self.http_cache.aget(self.client, url, params=params, headers=headers,
+                                                  rate_limiter=self.rate_limiter)
+        except httpx.HTTPError as e:
+            logger.error(f"{source} API request failed: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.error(f"{source} API error: {response.status_code}")
+            return None
+        
+        try:
+            data = response.json()
+        except ValueError as e:
+            # HTML error pages and truncated bodies; losing one page must not fail the whole search
+            logger.error(f"{source} API returned invalid JSON: {e}")
+            return None
+        if not isinstance(data, dict):
+            logger.error(f"{source} API returned {type(data).__name__} instead of an object")
+            return None
+        return data
+    
     def _parse_jsearch_job(self, job_data: Dict[str, Any]) -> Optional[JobListing]:
         """Parse job data from JSearch API"""
         try:
@@ -220,43 +292,15 @@ class RealJobScraper:
         if not text:
             return []
         
-        # Common technical skills to look for
-        skill_keywords = {
-            "Programming Languages": ["Python", "JavaScript", "Java", "C++", "C#", "TypeScript", 
-                                     "Go", "Ruby", "PHP", "Swift", "Kotlin", "Rust", "Scala", "R"],
-            "Web Frameworks": ["React", "Angular", "Vue", "Node.js", "Django", "Flask", 
-                              "Express", "Spring", "ASP.NET", "Laravel", "Rails"],
-            "Databases": ["SQL", "MongoDB", "PostgreSQL", "MySQL", "Redis", "Elasticsearch", 
-                         "DynamoDB", "Cassandra", "Oracle", "SQL Server"],
-            "Cloud": ["AWS", "Azure", "GCP", "Google Cloud", "Docker", "Kubernetes", 
-                     "Terraform", "Jenkins", "CI/CD"],
-            "Data Science": ["Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", 
-                           "Pandas", "NumPy", "Scikit-learn", "Data Analysis", "AI"],
-            "Mobile": ["iOS", "Android", "React Native", "Flutter", "Xamarin", "Mobile Development"],
-            "Other": ["Git", "REST API", "GraphQL", "Microservices", "Agile", "Scrum"]
-        }
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for category, skills in skill_keywords.items():
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    found_skills.append(JobSkill(
-                        name=skill,
-                        category="technical",
-                        importance=0.8
-                    ))
-        
-        # Remove duplicates
-        seen = set()
-        unique_skills = []
-        for skill in found_skills:
-            if skill.name not in seen:
-                seen.add(skill.name)
-                unique_skills.append(skill)
-        
-        return unique_skills[:20]  # Limit to 20 skills
+        skill_extractor = get_skill_extractor()
+        return [
+            JobSkill(
+                name=skill,
+                category="soft" if skill_extractor.category(skill) == "soft" else "technical",
+                importance=0.8
+            )
+            for skill in skill_extractor.extract(text)[:20]  # Limit to 20 skills
+        ]
     
     def _parse_experience_level(self, exp_data: Dict[str, Any]) -> str:
         """Parse experience level from job data"""
@@ -273,19 +317,24 @@ class RealJobScraper:
             return "Senior Level"
     
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse date string to datetime"""
+        """Parse date string to a naive UTC datetime, so API dates compare with each other"""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         if not date_str:
-            return datetime.now()
+            return now
         
         try:
             # Try ISO format
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            parsed = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
         except:
             try:
                 # Try other common formats
-                return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S")
+                parsed = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S")
             except:
-                return datetime.now()
+                return now
+        
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
     
     async def _get_mock_jobs(self) -> List[JobListing]:
         """Fallback to mock jobs when APIs are unavailable"""
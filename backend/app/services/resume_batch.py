@@ -0,0 +1,325 @@
+"""
+Batch resume ingestion
+Uploaded files (or the PDF/DOCX members of zip archives) are parsed in chunks
+on a process pool whose workers each keep a loaded ResumeParser, with spaCy
+run over every chunk through nlp.pipe. Each parsed chunk is bulk-inserted and
+its per-file results are yielded as soon as it finishes. File count, file size
+and batch size limits are enforced while uploads are read and unzipped.
+"""
+import asyncio
+import io
+import logging
+import os
+import time
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
+from pymongo.errors import BulkWriteError
+from app.repositories.resume_repository import ResumeRepository
+from app.services.resume_cache import ResumeCache
+from app.services.resume_parser import ResumeParser
+from app.utils.executor import ExecutorPool, run_blocking
+
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+# (filename, file content)
+ResumeFile = Tuple[str, bytes]
+
+# Uploads are read in pieces of this size so limits stop oversized files early
+READ_CHUNK_BYTES = 1024 * 1024
+
+class Upload(Protocol):
+    """An uploaded file, such as FastAPI's UploadFile"""
+    filename: Optional[str]
+
+    def read(self, size: int = -1) -> Awaitable[bytes]: ...
+
+async def read_limited(read: Callable[[int], Awaitable[bytes]], limit: int) -> Optional[bytes]:
+    """Read a stream in chunks; None once it is larger than limit bytes"""
+    parts, size = [], 0
+    while True:
+        part = await read(min(READ_CHUNK_BYTES, limit - size + 1))
+        if not part:
+            return b"".join(parts)
+        size += len(part)
+        if size > limit:
+            return None
+        parts.append(part)
+
+_parser: Optional[ResumeParser] = None
+
+def _worker_parser() -> ResumeParser:
+    global _parser
+    if _parser is None:
+        _parser = ResumeParser()
+    return _parser
+
+def _init_worker():
+    """Process pool initializer: load the parser models once per worker"""
+    parser = _worker_parser()
+    try:
+        parser.nlp
+        parser.skill_extractor
+    except Exception as e:
+        # Surface the error on the first chunk instead of breaking the pool
+        logger.warning(f"Could not preload resume parser models: {e}")
+
+def parse_chunk(files: List[ResumeFile]) -> List[Dict[str, Any]]:
+    """
+    Parse a chunk of resume files in a worker.
+
+    Returns:
+        One result per file, in order: {"filename", "resume"} or {"filename", "error"}
+    """
+    parser = _worker_parser()
+    results: List[Dict[str, Any]] = [{"filename": filename} for filename, _ in files]
+
+    texts, positions = [], []
+    for position, (filename, content) in enumerate(files):
+        try:
+            texts.append(parser.extract_text(content, filename))
+            positions.append(position)
+        except Exception as e:
+            results[position]["error"] = f"Could not read file: {e}"
+
+    try:
+        parsed = parser.parse_texts(texts)
+    except Exception:
+        # One bad document fails the whole pipe; parse one at a time to isolate it
+        parsed = []
+        for text in texts:
+            try:
+                parsed.extend(parser.parse_texts([text]))
+            except Exception as e:
+                parsed.append(e)
+
+    for position, parsed_data in zip(positions, parsed):
+        try:
+            if isinstance(parsed_data, Exception):
+                raise parsed_data
+            resume = parser.to_resume(parsed_data)
+            resume.id = str(uuid.uuid4())
+            results[position]["resume"] = resume
+        except Exception as e:
+            results[position]["error"] = f"Could not parse resume: {e}"
+    return results
+
+class ResumeBatchProcessor:
+    def __init__(self, repository: Optional[ResumeRepository] = None):
+        self.repository = repository or ResumeRepository()
+        self.chunk_size = int(os.getenv("RESUME_BATCH_CHUNK_SIZE", "16"))
+        self.max_files = int(os.getenv("RESUME_BATCH_MAX_FILES", "1000"))
+        self.max_file_bytes = int(float(os.getenv("RESUME_BATCH_MAX_FILE_MB", "10")) * 1024 * 1024)
+        # Uploaded bytes, and unzipped bytes of the files to parse, per batch
+        self.max_total_bytes = int(float(os.getenv("RESUME_BATCH_MAX_TOTAL_MB", "200")) * 1024 * 1024)
+        self.pool = ExecutorPool(
+            "resume-batch",
+            kind=os.getenv("RESUME_BATCH_EXECUTOR", "process").lower(),
+            max_workers=int(os.getenv("RESUME_BATCH_WORKERS", "0")) or None,
+            initializer=_init_worker
+        )
+
+    def _batch_full(self) -> str:
+        return f"Batch size limit of {self.max_total_bytes / (1024 * 1024):g} MB reached"
+
+    async def read_uploads(self, files: List[Upload]) -> Tuple[List[ResumeFile], List[Dict[str, Any]]]:
+        """
+        Read uploaded files, stopping at the first byte past a limit instead of
+        buffering whole oversized uploads. Resume files are limited to
+        RESUME_BATCH_MAX_FILE_MB, zip archives only by the batch total.
+
+        Returns:
+            (uploads that were read, results for rejected files)
+        """
+        uploads, rejected = [], []
+        total = 0
+        resume_files = 0
+        for file in files:
+            filename = file.filename or "upload"
+            is_zip = filename.lower().endswith('.zip')
+            if not is_zip and not filename.lower().endswith(RESUME_EXTENSIONS):
+                rejected.append({"filename": filename, "error": "Only PDF and DOCX files are supported"})
+                continue
+            if not is_zip and resume_files >= self.max_files:
+                rejected.append({"filename": filename, "error": f"Batch limit of {self.max_files} files reached"})
+                continue
+
+            remaining = self.max_total_bytes - total
+            limit = remaining if is_zip else min(self.max_file_bytes, remaining)
+            content = await read_limited(file.read, limit)
+            if content is None:
+                too_large = not is_zip and limit == self.max_file_bytes
+                rejected.append({"filename": filename,
+                                 "error": "File too large" if too_large else self._batch_full()})
+                continue
+
+            total += len(content)
+            resume_files += not is_zip
+            uploads.append((filename, content))
+        return uploads, rejected
+
+    def expand(self, uploads: List[ResumeFile]) -> Tuple[List[ResumeFile], List[Dict[str, Any]]]:
+        """
+        Split uploads into resume files, unpacking zip archives. Members are inflated
+        only up to the per-file limit and while the batch stays under its total size.
+
+        Returns:
+            (files to parse, results for rejected files)
+        """
+        files, rejected = [], []
+        total = 0
+        batch_full = self._batch_full()
+
+        def add(filename: str, content: bytes):
+            nonlocal total
+            if not filename.lower().endswith(RESUME_EXTENSIONS):
+                rejected.append({"filename": filename, "error": "Only PDF and DOCX files are supported"})
+            elif len(content) > self.max_file_bytes:
+                rejected.append({"filename": filename, "error": "File too large"})
+            elif len(files) >= self.max_files:
+                rejected.append({"filename": filename, "error": f"Batch limit of {self.max_files} files reached"})
+            elif total + len(content) > self.max_total_bytes:
+                rejected.append({"filename": filename, "error": batch_full})
+            else:
+                files.append((filename, content))
+                total += len(content)
+
+        for filename, content in uploads:
+            if not filename.lower().endswith('.zip'):
+                add(filename, content)
+                continue
+
+            try:
+                with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                    for member in archive.infolist():
+                        name = member.filename
+                        member_name = f"{filename}/{name}"
+                        if (member.is_dir() or name.startswith('__MACOSX/') or Path(name).name.startswith('.')
+                                or not name.lower().endswith(RESUME_EXTENSIONS)):
+                            continue
+                        if len(files) >= self.max_files:
+                            rejected.append({"filename": member_name,
+                                             "error": f"Batch limit of {self.max_files} files reached"})
+                            continue
+
+                        # Declared sizes can lie, so inflate at most one byte past what is allowed
+                        limit = min(self.max_file_bytes, self.max_total_bytes - total)
+                        if member.file_size > limit:
+                            data = None
+                        else:
+                            try:
+                                with archive.open(member) as member_file:
+                                    data = member_file.read(limit + 1)
+                            except Exception as e:
+                                rejected.append({"filename": member_name, "error": f"Could not unzip file: {e}"})
+                                continue
+
+                        if data is None or len(data) > limit:
+                            too_large = limit == self.max_file_bytes
+                            rejected.append({"filename": member_name,
+                                             "error": "File too large" if too_large else batch_full})
+                            continue
+                        add(member_name, data)
+            except zipfile.BadZipFile as e:
+                rejected.append({"filename": filename, "error": f"Invalid zip archive: {e}"})
+        return files, rejected
+
+    async def process(self, uploads: List[ResumeFile],
+                      fallback_cache: Optional[ResumeCache] = None,
+                      rejected_uploads: Optional[List[Dict[str, Any]]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parse and store uploaded resumes, yielding one result per file as chunks finish, then a summary.
+
+        Args:
+            uploads: (filename, content) pairs; zip archives are unpacked
+            fallback_cache: Where resumes go when the database does not store them
+            rejected_uploads: Results for uploads read_uploads already rejected
+        """
+        start = time.perf_counter()
+        files, rejected = await run_blocking(self.expand, uploads)
+        rejected = (rejected_uploads or []) + rejected
+        counts = {"files": len(files) + len(rejected), "stored": 0, "cached": 0, "errors": len(rejected)}
+
+        for result in rejected:
+            yield {**result, "status": "error"}
+
+        chunks = [files[i:i + self.chunk_size] for i in range(0, len(files), self.chunk_size)]
+        tasks = [asyncio.ensure_future(self._parse(chunk)) for chunk in chunks]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await self._store(await next_done, fallback_cache):
+                    counts["errors" if result["status"] == "error" else result["status"]] += 1
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        counts["duration_seconds"] = round(time.perf_counter() - start, 3)
+        logger.info(f"Resume batch processed: {counts}")
+        yield {"summary": counts}
+
+    async def _parse(self, chunk: List[ResumeFile]) -> List[Dict[str, Any]]:
+        try:
+            return await self.pool.run(parse_chunk, chunk)
+        except Exception as e:
+            # The worker itself failed (e.g. it was killed); report every file of the chunk
+            logger.error(f"Resume batch chunk failed: {e}")
+            return [{"filename": filename, "error": f"Worker failed: {e}"} for filename, _ in chunk]
+
+    async def _store(self, results: List[Dict[str, Any]],
+                     fallback_cache: Optional[ResumeCache]) -> List[Dict[str, Any]]:
+        """
+        Bulk-insert the parsed resumes of a chunk and turn results into response lines.
+
+        Resumes the database did not take go to fallback_cache, or are reported as
+        errors without one. The insert is unordered, so after a partial failure only
+        the resumes with a write error are affected.
+        """
+        resumes = [result["resume"] for result in results if "resume" in result]
+        # Index into resumes -> reason it was not stored
+        failed: Dict[int, str] = {}
+        if resumes:
+            try:
+                await self.repository.create_many(resumes)
+            except BulkWriteError as e:
+                failed = {error["index"]: error.get("errmsg", "Write failed")
+                          for error in e.details.get("writeErrors", [])}
+                logger.warning(f"Could not store {len(failed)} of {len(resumes)} resumes")
+            except Exception as e:
+                logger.warning(f"Database unavailable: {e}")
+                failed = {index: str(e) for index in range(len(resumes))}
+
+        if fallback_cache is not None:
+            for index in failed:
+                fallback_cache.add(resumes[index])
+
+        lines = []
+        index = 0
+        for result in results:
+            if "resume" not in result:
+                lines.append({"filename": result["filename"], "status": "error", "error": result["error"]})
+                continue
+
+            resume = result["resume"]
+            line = {"filename": result["filename"], "status": "stored", "id": resume.id,
+                    "name": resume.name, "skills": len(resume.skills)}
+            if index in failed:
+                if fallback_cache is not None:
+                    line["status"] = "cached"
+                else:
+                    line.update(status="error", error=failed[index])
+            lines.append(line)
+            index += 1
+        return lines
+
+_processor: Optional[ResumeBatchProcessor] = None
+
+def get_batch_processor() -> ResumeBatchProcessor:
+    """Get the process-wide batch processor"""
+    global _processor
+    if _processor is None:
+        _processor = ResumeBatchProcessor()
+    return _processor
@@ -0,0 +1,123 @@
+"""
+Fallback storage for resumes while the database is unavailable
+Resumes that could not be stored are written through to MongoDB by a
+background task once the database is reachable again. Until then they are held
+outside the cache limits, so an outage cannot evict them; once written (or
+rejected) they stay readable from a bounded cache (entries, bytes and TTL
+limits, LRU eviction).
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Optional
+from pymongo.errors import BulkWriteError
+from app.models.resume import Resume
+from app.repositories.resume_repository import ResumeRepository
+from app.utils.cache import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+# Duplicate key: the resume was already written, e.g. by an earlier partial flush
+DUPLICATE_KEY_ERROR = 11000
+
+class ResumeCache:
+    def __init__(self, repository: Optional[ResumeRepository] = None):
+        self.repository = repository or ResumeRepository()
+        self.cache = BoundedCache(
+            max_entries=int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "1000")),
+            max_bytes=int(float(os.getenv("RESUME_CACHE_MAX_MB", "64")) * 1024 * 1024),
+            ttl=float(os.getenv("RESUME_CACHE_TTL", "86400")),
+            sizeof=lambda resume: len(resume.model_dump_json())
+        )
+        self.flush_interval = float(os.getenv("RESUME_CACHE_FLUSH_INTERVAL", "30"))
+
+        # Resumes not yet written to the database, by ID
+        self._pending: Dict[str, Resume] = {}
+        self.written = 0
+        self.failed = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._pending or resume_id in self.cache
+
+    def get(self, resume_id: str) -> Optional[Resume]:
+        resume = self.cache.get(resume_id)
+        return resume if resume is not None else self._pending.get(resume_id)
+
+    def add(self, resume: Resume):
+        """Keep a resume the database did not accept, to be written once it is back"""
+        self._pending[resume.id] = resume
+        self.cache.set(resume.id, resume)
+
+    async def flush(self) -> int:
+        """
+        Write pending resumes to the database; returns how many were written, raises while it is down.
+
+        Resumes the database rejects for another reason than already having them
+        would fail again on every flush, so they are counted as failed and dropped.
+        """
+        pending = list(self._pending.values())
+        if not pending:
+            return 0
+
+        try:
+            await self.repository.create_many(pending)
+        except BulkWriteError as e:
+            other_errors = [error for error in e.details.get("writeErrors", [])
+                            if error.get("code") != DUPLICATE_KEY_ERROR]
+            if other_errors:
+                failed = {pending[error["index"]].id for error in other_errors}
+                logger.error(f"Dropping {len(failed)} cached resumes the database rejected: "
+                             f"{other_errors[0].get('errmsg')}")
+                for resume_id in failed:
+                    self._pending.pop(resume_id, None)
+                self.failed += len(failed)
+                pending = [resume for resume in pending if resume.id not in failed]
+
+        for resume in pending:
+            self._pending.pop(resume.id, None)
+        self.written += len(pending)
+        logger.info(f"Wrote {len(pending)} cached resumes to the database")
+        return len(pending)
+
+    def start(self):
+        """Flush pending resumes in the background every RESUME_CACHE_FLUSH_INTERVAL seconds"""
+        if self._task is None and self.flush_interval > 0:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._pending:
+                continue
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.debug(f"Database still unavailable, {len(self._pending)} resumes pending: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.cache.stats(),
+            "pending_writes": len(self._pending),
+            "written": self.written,
+            "failed": self.failed
+        }
+
+_cache: Optional[ResumeCache] = None
+
+def get_resume_cache() -> ResumeCache:
+    """Get the process-wide resume fallback cache"""
+    global _cache
+    if _cache is None:
+        _cache = ResumeCache()
+    return _cache
@@ -0,0 +1,129 @@
+"""
+Content-addressed cache of resume parse results
+Uploads are keyed by the SHA-256 of their bytes, so re-uploading the same CV
+skips text extraction, spaCy and skillNer. Lookups go to an in-process LRU
+first, then to MongoDB, which is shared by every worker and survives restarts.
+MongoDB keeps only the fields needed to build a Resume, not the CV's full text,
+and is skipped while the database is unreachable.
+"""
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from app.database import database_available
+from app.repositories.parse_cache_repository import ResumeParseCacheRepository
+from app.services.resume_parser import ResumeParser
+from app.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Bump when ResumeParser output changes so stale results are not served
+PARSER_VERSION = "1"
+
+# Lookup outcomes reported to clients
+HIT_MEMORY = "hit-memory"
+HIT_DATABASE = "hit-database"
+MISS = "miss"
+DISABLED = "disabled"
+
+class ResumeParseCache:
+    def __init__(self, repository: Optional[ResumeParseCacheRepository] = None):
+        self.enabled = os.getenv("RESUME_PARSE_CACHE_ENABLED", "true").lower() == "true"
+        self.memory = LRUCache(max_entries=int(os.getenv("RESUME_PARSE_CACHE_SIZE", "256")))
+        self.repository = repository or ResumeParseCacheRepository()
+        self.parser = ResumeParser()
+
+        self.lookups = {HIT_MEMORY: 0, HIT_DATABASE: 0, MISS: 0}
+        self.database_errors = 0
+        self.parse_seconds_saved = 0.0
+
+    @staticmethod
+    def key(content: bytes) -> str:
+        """Cache key of an uploaded file"""
+        return f"v{PARSER_VERSION}:{hashlib.sha256(content).hexdigest()}"
+
+    async def get(self, key: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Return (cached entry, lookup outcome); the entry has "parsed" and "parse_seconds" """
+        entry = self.memory.get(key)
+        if entry is not None:
+            return entry, HIT_MEMORY
+
+        if not database_available():
+            return None, MISS
+        try:
+            record = await self.repository.get(key)
+        except Exception as e:
+            self.database_errors += 1
+            logger.warning(f"Resume parse cache database unavailable: {e}")
+            record = None
+
+        if record is None:
+            return None, MISS
+
+        entry = {"parsed": record["parsed"], "parse_seconds": record.get("parse_seconds", 0.0)}
+        self.memory.set(key, entry)
+        return entry, HIT_DATABASE
+
+    async def set(self, key: str, parsed: Dict[str, Any], parse_seconds: float):
+        self.memory.set(key, {"parsed": parsed, "parse_seconds": parse_seconds})
+        if not database_available():
+            return
+        try:
+            await self.repository.set(key, self.parser.without_raw_text(parsed), parse_seconds)
+        except Exception as e:
+            self.database_errors += 1
+            logger.warning(f"Could not store resume parse in the database: {e}")
+
+    async def parse(self, content: bytes,
+                    parse: Callable[[], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], str]:
+        """
+        Return the parse result for an uploaded file, calling parse() only on a cache miss.
+
+        Args:
+            content: Uploaded file bytes
+            parse: Coroutine function producing the parse result
+
+        Returns:
+            (parse result, lookup outcome)
+        """
+        if not self.enabled:
+            return await parse(), DISABLED
+
+        key = self.key(content)
+        entry, outcome = await self.get(key)
+        self.lookups[outcome] += 1
+        if entry is not None:
+            self.parse_seconds_saved += entry["parse_seconds"]
+            logger.info(f"Resume parse cache {outcome} for {key}")
+            return entry["parsed"], outcome
+
+        start = time.perf_counter()
+        parsed = await parse()
+        await self.set(key, parsed, round(time.perf_counter() - start, 3))
+        return parsed, outcome
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit counters by tier and the parse time hits have saved"""
+        total = sum(self.lookups.values())
+        hits = self.lookups[HIT_MEMORY] + self.lookups[HIT_DATABASE]
+        return {
+            "enabled": self.enabled,
+            "lookups": total,
+            "hits_memory": self.lookups[HIT_MEMORY],
+            "hits_database": self.lookups[HIT_DATABASE],
+            "misses": self.lookups[MISS],
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "parse_seconds_saved": round(self.parse_seconds_saved, 3),
+            "database_errors": self.database_errors,
+            "memory": self.memory.stats()
+        }
+
+_cache: Optional[ResumeParseCache] = None
+
+def get_parse_cache() -> ResumeParseCache:
+    """Get the process-wide resume parse cache"""
+    global _cache
+    if _cache is None:
+        _cache = ResumeParseCache()
+    return _cache
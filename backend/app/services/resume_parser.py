@@ -1,45 +1,100 @@
-import pypdf  # Modern PDF parser
-import spacy
+import io
 import re
-from typing import Dict, List, Any, BinaryIO, Optional
+from typing import Dict, List, Any, BinaryIO, Optional, Union
 import docx
 from app.models.resume import Resume, Contact, Education, Experience, Skill
-from skillNer.general_params import SKILL_DB
-from skillNer.skill_extractor_class import SkillExtractor
+from app.services.model_registry import get_spacy_nlp, get_skillner_extractor
 from pathlib import Path
+from app.utils.nlp import ENTITY_COMPONENTS, pipe_texts, process_text
+from app.utils.pdf_text import extract_pdf_text
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_lg")
-except:
-    # If model not found, download it
-    import os
-    os.system("python -m spacy download en_core_web_lg")
-    nlp = spacy.load("en_core_web_lg")
+# Resume fields read entities only; skillNer runs its own pipeline
+RESUME_COMPONENTS = ENTITY_COMPONENTS
 
-# Initialize skill extractor
-skill_extractor = SkillExtractor(nlp, SKILL_DB, PhraseMatcher=nlp.matcher)
+# A file path, an open binary file, or the file content in memory
+ResumeSource = Union[str, Path, BinaryIO, bytes, memoryview]
 
 class ResumeParser:
-    def __init__(self):
-        self.nlp = nlp
-        self.skill_extractor = skill_extractor
+    # spaCy and skillNer come from the shared model registry and are loaded on first use
 
-    def parse_resume(self, file_path: str) -> Dict:
-        """Parse resume and extract key information."""
-        file_extension = Path(file_path).suffix.lower()
+    @property
+    def nlp(self):
+        return get_spacy_nlp()
+
+    @property
+    def skill_extractor(self):
+        return get_skillner_extractor()
+
+    def parse_resume(self, source: ResumeSource, filename: Optional[str] = None) -> Dict:
+        """
+        Parse resume and extract key information.
+
+        Args:
+            source: File path, file-like object (e.g. a spooled upload) or the file's bytes
+            filename: Name used to pick the format; defaults to the path for path sources
+        """
+        text = self.extract_text(source, filename)
+            
+        # Process text with spaCy
+        doc = process_text(self.nlp, text, RESUME_COMPONENTS)
         
+        return self._parse_text(text, doc)
+
+    def parse_texts(self, texts: List[str], batch_size: Optional[int] = None,
+                    n_process: Optional[int] = None) -> List[Dict]:
+        """Parse many extracted resume texts, running spaCy over them in batches."""
+        docs = pipe_texts(self.nlp, texts, RESUME_COMPONENTS, batch_size=batch_size, n_process=n_process)
+        return [self._parse_text(text, doc) for text, doc in zip(texts, docs)]
+
+    def extract_text(self, source: ResumeSource, filename: Optional[str] = None) -> str:
+        """Extract text from a PDF or DOCX file given by path, file-like object or bytes."""
+        if isinstance(source, (str, Path)):
+            filename = filename or str(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        else:
+            # Uploads may already have been read; parsers expect to start at the beginning
+            source.seek(0)
+        
+        file_extension = Path(filename or "").suffix.lower()
         if file_extension == '.pdf':
-            text = self._extract_text_from_pdf(file_path)
+            return self._extract_text_from_pdf(source)
         elif file_extension in ['.docx', '.doc']:
-            text = self._extract_text_from_docx(file_path)
+            return self._extract_text_from_docx(source)
+        raise ValueError(f"Unsupported file format: {file_extension}")
+
+    def to_resume(self, parsed_data: Dict) -> Resume:
+        """Build a Resume from parse_resume/parse_texts output, or its without_raw_text form."""
+        text = parsed_data.get('raw_text') or ""
+        if 'contact' in parsed_data:
+            contact = dict(parsed_data['contact'])
+            summary = parsed_data.get('summary')
         else:
-            raise ValueError(f"Unsupported file format: {file_extension}")
-            
-        # Process text with spaCy
-        doc = self.nlp(text)
+            contact = self._extract_contact_info(text)
+            summary = self._extract_summary(text) or None
+        contact.update({key: parsed_data[key] for key in ('email', 'phone') if parsed_data.get(key)})
         
-        # Extract information
+        return Resume(
+            name=parsed_data.get('name') or "Unknown",
+            contact=Contact(**contact),
+            summary=summary,
+            skills=[Skill(name=skill) for skill in parsed_data.get('skills', [])],
+            experience=[Experience(**item) for item in parsed_data.get('experience', [])],
+            education=[Education(**item) for item in parsed_data.get('education', [])]
+        )
+
+    def without_raw_text(self, parsed_data: Dict) -> Dict:
+        """Parse output without the full resume text, keeping the contact and summary to_resume derives from it."""
+        if 'raw_text' not in parsed_data:
+            return parsed_data
+        text = parsed_data['raw_text'] or ""
+        compact = {key: value for key, value in parsed_data.items() if key != 'raw_text'}
+        compact['contact'] = self._extract_contact_info(text)
+        compact['summary'] = self._extract_summary(text) or None
+        return compact
+
+    def _parse_text(self, text: str, doc) -> Dict:
+        """Extract resume fields from text and its spaCy doc."""
         parsed_data = {
             'name': self._extract_name(doc),
             'email': self._extract_email(text),
@@ -52,15 +107,11 @@ class ResumeParser:
         
         return parsed_data
 
-    def _extract_text_from_pdf(self, file_path: str) -> str:
+    def _extract_text_from_pdf(self, file_path: Union[str, Path, BinaryIO]) -> str:
         """Extract text from PDF file."""
-        reader = pypdf.PdfReader(file_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return extract_pdf_text(file_path)
 
-    def _extract_text_from_docx(self, file_path: str) -> str:
+    def _extract_text_from_docx(self, file_path: Union[str, Path, BinaryIO]) -> str:
         """Extract text from DOCX file."""
         doc = docx.Document(file_path)
         return "\n".join([paragraph.text for paragraph in doc.paragraphs])
@@ -0,0 +1,137 @@
+"""
+Shared skill extraction engine
+Matches a skill taxonomy (name, aliases, category) against text in a single
+pass and returns normalized canonical skill names
+"""
+import json
+import os
+import re
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "../data/skill_taxonomy.json")
+
+# A skill must not be glued to a surrounding word character. Unlike \b this
+# also works for skills that start or end with symbols, such as "c++" or "c#".
+_BOUNDARY_START = r'(?<!\w)'
+_BOUNDARY_END = r'(?!\w)'
+
+class SkillExtractor:
+    def __init__(self, taxonomy: List[Dict[str, Any]]):
+        """
+        Args:
+            taxonomy: List of {"name", "aliases", "category"} skill definitions
+        """
+        self._canonical: Dict[str, str] = {}
+        self._categories: Dict[str, Optional[str]] = {}
+
+        for entry in taxonomy:
+            name = entry["name"]
+            self._categories[name] = entry.get("category")
+            for term in [name] + list(entry.get("aliases", [])):
+                key = term.strip().lower()
+                if key in self._canonical and self._canonical[key] != name:
+                    logger.warning(f"Skill term '{term}' maps to both {self._canonical[key]} and {name}")
+                    continue
+                self._canonical[key] = name
+
+        trie = self._build_trie(self._canonical)
+        # The lookahead makes every position a candidate start, so overlapping
+        # terms are all found in one scan; within a start the longest term wins
+        self._pattern = re.compile(
+            r'(?=' + _BOUNDARY_START + '(' + self._trie_pattern(trie) + ')' + _BOUNDARY_END + ')'
+        )
+        # The scan keeps only the longest term at each start, so shorter terms that
+        # are word-bounded prefixes of it (e.g. "react" in "react native") are added
+        # from this table, as a separate search per term would have found them
+        self._nested = {term: self._nested_terms(trie, term) for term in self._canonical}
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillExtractor":
+        """Load a taxonomy from a JSON file"""
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def extract(self, text: str) -> List[str]:
+        """Extract canonical skill names in order of first appearance"""
+        if not text:
+            return []
+
+        found = {}
+        for term in self._scan(text.lower()):
+            found.setdefault(self._canonical[term], None)
+            for nested in self._nested[term]:
+                found.setdefault(self._canonical[nested], None)
+        return list(found)
+
+    def extract_many(self, texts: List[str]) -> List[List[str]]:
+        """Extract skills from a batch of texts"""
+        return [self.extract(text) for text in texts]
+
+    def normalize(self, name: str) -> str:
+        """Map a skill name or alias to its canonical name; unknown names are lowercased"""
+        key = name.strip().lower()
+        return self._canonical.get(key, key)
+
+    def is_known(self, name: str) -> bool:
+        """Whether a name or alias is part of the taxonomy"""
+        return name.strip().lower() in self._canonical
+
+    def category(self, name: str) -> Optional[str]:
+        """Category of a skill, if it is part of the taxonomy"""
+        return self._categories.get(self.normalize(name))
+
+    def _scan(self, text: str) -> List[str]:
+        return [match.group(1) for match in self._pattern.finditer(text)]
+
+    @staticmethod
+    def _build_trie(terms) -> Dict[str, Any]:
+        """Nested dicts keyed by character; '' marks the end of a term"""
+        trie: Dict[str, Any] = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = True
+        return trie
+
+    @staticmethod
+    def _nested_terms(trie: Dict[str, Any], term: str) -> List[str]:
+        """Shorter terms that are word-bounded prefixes of a term: the terms ending
+        on its trie path where the next character is not a word character"""
+        nested = []
+        node = trie
+        for i, char in enumerate(term[:-1], 1):
+            node = node[char]
+            if '' in node and not re.match(r'\w', term[i]):
+                nested.append(term[:i])
+        return nested
+
+    @staticmethod
+    def _trie_pattern(trie: Dict[str, Any]) -> str:
+        """Build a regex alternation factored by common prefixes (a trie), so the
+        engine branches one character at a time instead of trying every term"""
+        def to_pattern(node: Dict[str, Any]) -> str:
+            terminal = '' in node
+            branches = [re.escape(char) + to_pattern(child)
+                        for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            # Greedy optional: the longest term is tried first
+            return f'(?:{body})?' if terminal else body
+
+        return to_pattern(trie)
+
+_extractor: Optional[SkillExtractor] = None
+
+def get_skill_extractor() -> SkillExtractor:
+    """Get the process-wide skill extractor, built once from the configured taxonomy"""
+    global _extractor
+    if _extractor is None:
+        path = os.getenv("SKILL_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+        _extractor = SkillExtractor.from_file(path)
+        logger.info(f"Loaded skill taxonomy with {len(_extractor._categories)} skills from {path}")
+    return _extractor
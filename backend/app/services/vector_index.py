@@ -0,0 +1,217 @@
+"""
+Approximate nearest-neighbour index over job embeddings
+Inverted-file (IVF) index in pure NumPy: vectors are bucketed by their
+nearest k-means centroid and a query only scans the closest buckets
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class IVFIndex:
+    def __init__(self,
+                 n_probe: int = 16,
+                 train_threshold: int = 2048,
+                 kmeans_iterations: int = 10,
+                 seed: int = 42):
+        """
+        Args:
+            n_probe: Number of closest lists scanned per query
+            train_threshold: Below this many vectors queries use exact search
+            kmeans_iterations: Lloyd iterations used to train the centroids
+            seed: Random seed for centroid initialisation
+        """
+        self.n_probe = n_probe
+        self.train_threshold = train_threshold
+        self.kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+
+        self._dim: Optional[int] = None
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+
+        self._centroids: Optional[np.ndarray] = None
+        self._row_list = np.zeros(0, dtype=np.int64)
+        self._lists: List[List[int]] = []
+        self._list_arrays: Dict[int, np.ndarray] = {}
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, ids: List[str], vectors: np.ndarray):
+        """Add or replace vectors; existing IDs are overwritten"""
+        if not ids:
+            return
+
+        vectors = self._normalize(np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1))
+        if self._dim is None:
+            self._dim = vectors.shape[1]
+            self._vectors = np.zeros((0, self._dim), dtype=np.float32)
+        elif vectors.shape[1] != self._dim:
+            raise ValueError(f"Expected vectors of dimension {self._dim}, got {vectors.shape[1]}")
+
+        rows = []
+        for item_id in ids:
+            if item_id in self._rows:
+                row = self._rows[item_id]
+                self._unassign(row)
+            else:
+                row = self._allocate_row()
+                self._ids[row] = item_id
+                self._rows[item_id] = row
+            rows.append(row)
+
+        rows = np.asarray(rows, dtype=np.int64)
+        self._vectors[rows] = vectors
+
+        if self.is_trained:
+            self._assign(rows)
+            # Retrain once the index has grown well past what the centroids saw
+            if len(self) > 4 * self._trained_size:
+                self.train()
+        elif len(self) >= self.train_threshold:
+            self.train()
+
+    def remove(self, ids: List[str]) -> int:
+        """Remove vectors by ID, returning how many were present"""
+        removed = 0
+        for item_id in ids:
+            row = self._rows.pop(item_id, None)
+            if row is None:
+                continue
+            self._unassign(row)
+            self._ids[row] = None
+            self._free_rows.append(row)
+            removed += 1
+        return removed
+
+    def train(self, n_lists: Optional[int] = None):
+        """Train k-means centroids on the current vectors and rebuild the lists"""
+        rows = np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows))
+        if len(rows) == 0:
+            return
+
+        n_lists = n_lists or max(1, int(np.sqrt(len(rows))))
+        n_lists = min(n_lists, len(rows))
+
+        # Train on a sample; 64 points per centroid is plenty for spherical k-means
+        sample_size = min(len(rows), n_lists * 64)
+        sample = self._vectors[self._rng.choice(rows, size=sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, size=n_lists, replace=False)].copy()
+
+        for _ in range(self.kmeans_iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for list_id in range(n_lists):
+                members = sample[assignment == list_id]
+                if len(members):
+                    centroids[list_id] = members.sum(axis=0)
+            centroids = self._normalize(centroids)
+
+        self._centroids = centroids
+        self._lists = [[] for _ in range(n_lists)]
+        self._list_arrays = {}
+        self._row_list = np.full(len(self._ids), -1, dtype=np.int64)
+        self._assign(rows)
+        self._trained_size = len(rows)
+
+        logger.info(f"Trained vector index with {n_lists} lists over {len(rows)} vectors")
+
+    def search(self, query: np.ndarray, k: int = 10, n_probe: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return up to k (id, cosine similarity) pairs, best first"""
+        if not self._rows:
+            return []
+
+        query = self._normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+
+        if self.is_trained:
+            n_probe = min(n_probe or self.n_probe, len(self._lists))
+            centroid_scores = self._centroids @ query
+            probe = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+            candidates = np.concatenate([self._list_array(list_id) for list_id in probe])
+        else:
+            return self.exact_search(query, k=k)
+
+        if len(candidates) == 0:
+            return []
+
+        return self._top_k(candidates, self._vectors[candidates] @ query, k)
+
+    def exact_search(self, query: np.ndarray, k: int = 10) -> List[Tuple[str, float]]:
+        """Brute-force search over every vector, used as the recall baseline"""
+        if not self._rows:
+            return []
+
+        query = self._normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+
+        # Score the contiguous block of rows and mask out freed ones
+        scores = self._vectors[:len(self._ids)] @ query
+        if self._free_rows:
+            scores[self._free_rows] = -np.inf
+        k = min(k, len(self._rows))
+        return self._top_k(np.arange(len(self._ids)), scores, k)
+
+    def _top_k(self, rows: np.ndarray, scores: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        k = min(k, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    def _allocate_row(self) -> int:
+        if self._free_rows:
+            return self._free_rows.pop()
+
+        row = len(self._ids)
+        self._ids.append(None)
+        if row >= len(self._vectors):
+            capacity = max(1024, 2 * len(self._vectors))
+            grown = np.zeros((capacity, self._dim), dtype=np.float32)
+            grown[:len(self._vectors)] = self._vectors
+            self._vectors = grown
+        return row
+
+    def _assign(self, rows: np.ndarray):
+        if len(self._row_list) < len(self._vectors):
+            self._row_list = np.concatenate([
+                self._row_list,
+                np.full(len(self._vectors) - len(self._row_list), -1, dtype=np.int64)
+            ])
+
+        list_ids = np.argmax(self._vectors[rows] @ self._centroids.T, axis=1)
+        for row, list_id in zip(rows.tolist(), list_ids.tolist()):
+            self._lists[list_id].append(row)
+            self._row_list[row] = list_id
+            self._list_arrays.pop(list_id, None)
+
+    def _unassign(self, row: int):
+        if not self.is_trained or row >= len(self._row_list):
+            return
+
+        list_id = int(self._row_list[row])
+        if list_id >= 0:
+            self._lists[list_id].remove(row)
+            self._row_list[row] = -1
+            self._list_arrays.pop(list_id, None)
+
+    def _list_array(self, list_id: int) -> np.ndarray:
+        array = self._list_arrays.get(list_id)
+        if array is None:
+            array = np.asarray(self._lists[list_id], dtype=np.int64)
+            self._list_arrays[list_id] = array
+        return array
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
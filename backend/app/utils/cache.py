@@ -0,0 +1,182 @@
+"""
+In-process caching utilities
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+class LRUCache:
+    def __init__(self, max_entries: int = 1024):
+        """
+        Args:
+            max_entries: Number of entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as recently used"""
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value without counting a lookup or changing its recency"""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries if full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a value"""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled; needed when the owner is sent to a worker process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+class BoundedCache(LRUCache):
+    """LRU cache also bounded by total size in bytes, with optional per-entry TTL"""
+
+    def __init__(self,
+                 max_entries: int = 1024,
+                 max_bytes: int = 0,
+                 ttl: float = 0,
+                 sizeof: Callable[[Any], int] = sys.getsizeof,
+                 on_evict: Optional[Callable[[Hashable, Any, str], None]] = None):
+        """
+        Args:
+            max_entries: Number of entries kept before the least recently used is evicted
+            max_bytes: Total size of the values before eviction (0 = unbounded)
+            ttl: Seconds an entry stays valid after it is set (0 = forever)
+            sizeof: Size of a value in bytes, computed once when it is set
+            on_evict: Called as on_evict(key, value, reason) for "size" and "expired" removals
+        """
+        super().__init__(max_entries)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.expirations = 0
+        self.bytes = 0
+        # key -> (expires_at, size); values live in _data as in LRUCache
+        self._meta: Dict[Hashable, Tuple[float, int]] = {}
+
+    def _remove(self, key: Hashable) -> Any:
+        value = self._data.pop(key)
+        self.bytes -= self._meta.pop(key)[1]
+        return value
+
+    def _expired(self, key: Hashable, now: float) -> bool:
+        expires_at = self._meta[key][0]
+        return bool(expires_at) and expires_at <= now
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data and not self._expired(key, time.monotonic())
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        evicted = None
+        with self._lock:
+            if key in self._data and self._expired(key, time.monotonic()):
+                evicted = (key, self._remove(key), "expired")
+                self.expirations += 1
+            if key not in self._data:
+                self.misses += 1
+                value = default
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                value = self._data[key]
+        self._notify([evicted] if evicted else [])
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        size = self.sizeof(value)
+        evicted = []
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = value
+            self._meta[key] = (time.monotonic() + self.ttl if self.ttl else 0.0, size)
+            self.bytes += size
+
+            # Expired entries go first, then the least recently used; the new entry always stays
+            now = time.monotonic()
+            for old_key in [k for k in self._data if k != key and self._expired(k, now)]:
+                evicted.append((old_key, self._remove(old_key), "expired"))
+                self.expirations += 1
+            while len(self._data) > 1 and (len(self._data) > self.max_entries
+                                           or (self.max_bytes and self.bytes > self.max_bytes)):
+                old_key = next(iter(self._data))
+                evicted.append((old_key, self._remove(old_key), "size"))
+                self.evictions += 1
+        self._notify(evicted)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._remove(key) if key in self._data else default
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._meta.clear()
+            self.bytes = 0
+
+    def _notify(self, evicted: List[Tuple[Hashable, Any, str]]):
+        # Outside the lock, so callbacks may use the cache
+        if self.on_evict:
+            for key, value, reason in evicted:
+                self.on_evict(key, value, reason)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats.update(bytes=self.bytes, max_bytes=self.max_bytes, ttl_seconds=self.ttl,
+                     expirations=self.expirations)
+        return stats
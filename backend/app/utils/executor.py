@@ -0,0 +1,145 @@
+"""
+Executors for running CPU-bound and blocking work off the event loop
+"""
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+def _timed_call(func: Callable, *args, **kwargs):
+    """Run func in the worker and report when it actually started"""
+    started_at = time.time()
+    result = func(*args, **kwargs)
+    return started_at, time.time(), result
+
+def _init_process_worker(initializer: Callable[[], None]):
+    from app.utils.pdf_text import mark_pool_worker
+    # Documents are already spread across this pool's workers
+    mark_pool_worker()
+    initializer()
+
+def _warm_worker():
+    """Process pool initializer: load models once per worker process"""
+    if os.getenv("CPU_EXECUTOR_WARMUP", "true").lower() == "true":
+        from app.services.model_registry import registry
+        registry.warm_up()
+
+# Every pool, for health metrics and shutdown
+_pools: Dict[str, "ExecutorPool"] = {}
+
+class ExecutorPool:
+    def __init__(self, name: str, kind: str = "thread", max_workers: Optional[int] = None,
+                 initializer: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            name: Name used in logs and metrics
+            kind: "thread" for GIL-releasing or blocking work, "process" for pure-Python CPU work
+            max_workers: Pool size, defaults to the number of CPUs
+            initializer: Run once in each worker process (default: warm up the model registry)
+        """
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.initializer = initializer or _warm_worker
+        _pools[name] = self
+
+        self._executor: Optional[Executor] = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # Callables and arguments must be picklable in this mode
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     initializer=functools.partial(_init_process_worker,
+                                                                                   self.initializer))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix=self.name)
+            logger.info(f"Started {self.kind} executor '{self.name}' with {self.max_workers} workers")
+        return self._executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) in the pool and await its result"""
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        self.submitted += 1
+        self.in_flight += 1
+
+        try:
+            started_at, finished_at, result = await loop.run_in_executor(
+                self.executor, functools.partial(_timed_call, func, *args, **kwargs)
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+        wait = max(0.0, started_at - submitted_at)
+        self.completed += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        self._total_run += finished_at - started_at
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and wait/run time metrics"""
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - self.max_workers),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self._total_wait / self.completed * 1000, 2) if self.completed else 0.0,
+            "max_wait_ms": round(self._max_wait * 1000, 2),
+            "avg_run_ms": round(self._total_run / self.completed * 1000, 2) if self.completed else 0.0
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+# CPU-bound work (parsing, encoding); a process pool when CPU_EXECUTOR=process
+cpu_executor = ExecutorPool(
+    "cpu",
+    kind=os.getenv("CPU_EXECUTOR", "thread").lower(),
+    max_workers=int(os.getenv("CPU_EXECUTOR_WORKERS", "0")) or None
+)
+
+# Blocking I/O and work that needs in-process state (caches, shared stores)
+blocking_executor = ExecutorPool(
+    "blocking",
+    kind="thread",
+    max_workers=int(os.getenv("BLOCKING_EXECUTOR_WORKERS", "16"))
+)
+
+async def run_cpu(func: Callable, *args, **kwargs) -> Any:
+    """Run CPU-bound work off the event loop"""
+    return await cpu_executor.run(func, *args, **kwargs)
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run blocking or stateful work in a thread off the event loop"""
+    return await blocking_executor.run(func, *args, **kwargs)
+
+def executor_stats() -> Dict[str, Any]:
+    return {name: pool.stats() for name, pool in _pools.items()}
+
+def shutdown_executors():
+    for pool in _pools.values():
+        pool.shutdown()
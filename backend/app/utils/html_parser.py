@@ -0,0 +1,231 @@
+"""
+Pluggable HTML parsing for job board scraping
+Card layouts are described with CSS selectors, compiled once per source for
+the fastest installed backend: selectolax, lxml, or BeautifulSoup (lxml
+tree builder, then the built-in html.parser)
+"""
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class CardLayout:
+    def __init__(self, card: str, text: Dict[str, str], href: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            card: Selector matching one element per job card
+            text: Field name -> selector whose stripped text is extracted
+            href: Field name -> selector of a link whose href is extracted
+        """
+        self.card = card
+        self.text = text
+        self.href = href or {}
+
+# tag, tag.class or tag[attr="value"] steps joined by descendant combinators
+_SIMPLE_STEP = re.compile(r'^([a-zA-Z][\w-]*)(?:\.([\w-]+)|\[([\w-]+)="?([^"\]]*)"?\])?$')
+
+def _simple_steps(selector: str) -> Optional[List[Tuple[str, Dict[str, str]]]]:
+    """Split a simple selector into (tag, attrs) steps, or None if it uses other syntax"""
+    steps = []
+    for part in selector.split():
+        match = _SIMPLE_STEP.match(part)
+        if not match:
+            return None
+        tag, css_class, attr, value = match.groups()
+        if css_class:
+            steps.append((tag, {"class": css_class}))
+        elif attr:
+            steps.append((tag, {attr: value}))
+        else:
+            steps.append((tag, {}))
+    return steps
+
+class ParserBackend(ABC):
+    """Extracts card fields from HTML; a missing element gives None"""
+
+    name = "base"
+
+    @abstractmethod
+    def compile(self, layout: CardLayout) -> Any:
+        """Prepare a layout's selectors for repeated extraction"""
+
+    @abstractmethod
+    def extract(self, html: str, compiled: Any) -> List[Dict[str, Optional[str]]]:
+        """Extract one dict of fields per card"""
+
+class SelectolaxBackend(ParserBackend):
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.parser import HTMLParser
+        self._parser = HTMLParser
+
+    def compile(self, layout: CardLayout) -> CardLayout:
+        # selectolax compiles selectors internally and caches them
+        return layout
+
+    def extract(self, html: str, compiled: CardLayout) -> List[Dict[str, Optional[str]]]:
+        cards = []
+        for node in self._parser(html).css(compiled.card):
+            fields = {}
+            for field, selector in compiled.text.items():
+                elem = node.css_first(selector)
+                fields[field] = elem.text().strip() if elem is not None else None
+            for field, selector in compiled.href.items():
+                elem = node.css_first(selector)
+                fields[field] = elem.attributes.get("href") if elem is not None else None
+            cards.append(fields)
+        return cards
+
+class LxmlBackend(ParserBackend):
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from lxml import etree
+        self._fromstring = lxml.html.fromstring
+        self._xpath = etree.XPath
+
+    def _selector(self, selector: str) -> Any:
+        """Compile simple selectors to XPath directly; anything else needs cssselect"""
+        steps = _simple_steps(selector)
+        if steps is None:
+            from lxml.cssselect import CSSSelector
+            return CSSSelector(selector)
+
+        path = "."
+        for tag, attrs in steps:
+            predicates = "".join(
+                f"[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]" if name == "class"
+                else f'[@{name}="{value}"]'
+                for name, value in attrs.items()
+            )
+            path += f"//{tag}{predicates}"
+        return self._xpath(path)
+
+    def compile(self, layout: CardLayout) -> Dict[str, Any]:
+        return {
+            "card": self._selector(layout.card),
+            "text": {field: self._selector(selector) for field, selector in layout.text.items()},
+            "href": {field: self._selector(selector) for field, selector in layout.href.items()}
+        }
+
+    def extract(self, html: str, compiled: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
+        if not html.strip():
+            return []
+
+        cards = []
+        for node in compiled["card"](self._fromstring(html)):
+            fields = {}
+            for field, selector in compiled["text"].items():
+                found = selector(node)
+                fields[field] = found[0].text_content().strip() if found else None
+            for field, selector in compiled["href"].items():
+                found = selector(node)
+                fields[field] = found[0].get("href") if found else None
+            cards.append(fields)
+        return cards
+
+class BeautifulSoupBackend(ParserBackend):
+    def __init__(self, features: str = "html.parser"):
+        """
+        Args:
+            features: BeautifulSoup tree builder ("lxml" or "html.parser")
+        """
+        import soupsieve
+        from bs4 import BeautifulSoup
+        if features == "lxml":
+            import lxml  # noqa: F401 - fail early so auto-selection can move on
+        self._soup = BeautifulSoup
+        self._soupsieve = soupsieve
+        self.features = features
+        self.name = f"bs4-{features}"
+
+    def _compile(self, selector: str) -> Any:
+        """Simple selectors become find() arguments, which bs4 matches much faster than soupsieve"""
+        steps = _simple_steps(selector)
+        return steps if steps is not None else self._soupsieve.compile(selector)
+
+    @staticmethod
+    def _select(node, compiled: Any) -> List[Any]:
+        if not isinstance(compiled, list):
+            return compiled.select(node)
+
+        nodes = [node]
+        for tag, attrs in compiled:
+            nodes = [found for parent in nodes for found in parent.find_all(tag, attrs=attrs)]
+        return nodes
+
+    @staticmethod
+    def _select_one(node, compiled: Any) -> Optional[Any]:
+        if not isinstance(compiled, list):
+            return compiled.select_one(node)
+
+        for tag, attrs in compiled:
+            node = node.find(tag, attrs=attrs)
+            if node is None:
+                return None
+        return node
+
+    def compile(self, layout: CardLayout) -> Dict[str, Any]:
+        return {
+            "card": self._compile(layout.card),
+            "text": {field: self._compile(selector) for field, selector in layout.text.items()},
+            "href": {field: self._compile(selector) for field, selector in layout.href.items()}
+        }
+
+    def extract(self, html: str, compiled: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
+        cards = []
+        for node in self._select(self._soup(html, self.features), compiled["card"]):
+            fields = {}
+            for field, selector in compiled["text"].items():
+                elem = self._select_one(node, selector)
+                fields[field] = elem.text.strip() if elem is not None else None
+            for field, selector in compiled["href"].items():
+                elem = self._select_one(node, selector)
+                fields[field] = elem.get("href") if elem is not None else None
+            cards.append(fields)
+        return cards
+
+BACKENDS = {
+    "selectolax": SelectolaxBackend,
+    "lxml": LxmlBackend,
+    "bs4-lxml": lambda: BeautifulSoupBackend("lxml"),
+    "html.parser": lambda: BeautifulSoupBackend("html.parser")
+}
+
+def create_backend(name: str = "auto") -> ParserBackend:
+    """Create the named backend, or the fastest installed one for "auto" """
+    if name != "auto":
+        return BACKENDS[name]()
+
+    for candidate in BACKENDS:
+        try:
+            return BACKENDS[candidate]()
+        except ImportError:
+            continue
+    raise ImportError("No HTML parser available; install beautifulsoup4")
+
+class CardExtractor:
+    """A layout compiled once for one backend"""
+
+    def __init__(self, layout: CardLayout, backend: ParserBackend):
+        self.layout = layout
+        self.backend = backend
+        self._compiled = backend.compile(layout)
+
+    def extract(self, html: str) -> List[Dict[str, Optional[str]]]:
+        return self.backend.extract(html, self._compiled)
+
+_backend: Optional[ParserBackend] = None
+
+def get_parser_backend() -> ParserBackend:
+    """Get the process-wide backend chosen by HTML_PARSER (default: auto)"""
+    global _backend
+    if _backend is None:
+        _backend = create_backend(os.getenv("HTML_PARSER", "auto"))
+        logger.info(f"Using HTML parser backend: {_backend.name}")
+    return _backend
@@ -0,0 +1,274 @@
+"""
+On-disk HTTP response cache for scrapers and job API clients
+Responses are keyed by URL and query params, served directly while fresh,
+and revalidated with ETag/Last-Modified once their TTL has passed
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import requests
+from app.utils.rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+class CachedResponse:
+    """Minimal response object shared by the sync and async clients"""
+
+    def __init__(self,
+                 status_code: int,
+                 headers: Dict[str, str],
+                 content: bytes,
+                 encoding: Optional[str] = None,
+                 from_cache: bool = False):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+class HTTPCache:
+    def __init__(self,
+                 directory: str,
+                 ttl: float = 300,
+                 max_bytes: int = 100 * 1024 * 1024,
+                 enabled: bool = True):
+        """
+        Args:
+            directory: Where cached responses are written
+            ttl: Seconds a response is served without revalidation
+            max_bytes: Disk budget; the least recently stored entries are evicted beyond it
+            enabled: When False, requests pass straight through
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key for a GET request"""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        return hashlib.sha256(json.dumps([url, items]).encode("utf-8")).hexdigest()
+
+    def get(self,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> CachedResponse:
+        """GET through the cache with requests"""
+        if not self.enabled:
+            response = requests.get(url, params=params, headers=headers, timeout=timeout)
+            return CachedResponse(response.status_code, dict(response.headers), response.content, response.encoding)
+
+        key = self.key(url, params)
+        entry = self._lookup(key)
+        if entry is not None and self._is_fresh(entry):
+            self.hits += 1
+            return self._to_response(entry)
+
+        response = requests.get(url, params=params, headers={**(headers or {}), **self._conditional_headers(entry)},
+                                timeout=timeout)
+        return self._handle(key, entry, response.status_code, dict(response.headers),
+                            response.content, response.encoding)
+
+    async def aget(self,
+                   client: httpx.AsyncClient,
+                   url: str,
+                   params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None,
+                   rate_limiter: Optional[HostRateLimiter] = None) -> CachedResponse:
+        """
+        GET through the cache with an httpx.AsyncClient.
+
+        Args:
+            rate_limiter: Acquired for the URL's host only when a request goes to the network
+        """
+        if not self.enabled:
+            await self._acquire(rate_limiter, url)
+            response = await client.get(url, params=params, headers=headers)
+            return CachedResponse(response.status_code, dict(response.headers), response.content, response.encoding)
+
+        key = self.key(url, params)
+        entry = await asyncio.to_thread(self._lookup, key)
+        if entry is not None and self._is_fresh(entry):
+            self.hits += 1
+            return self._to_response(entry)
+
+        await self._acquire(rate_limiter, url)
+        response = await client.get(url, params=params,
+                                    headers={**(headers or {}), **self._conditional_headers(entry)})
+        return await asyncio.to_thread(self._handle, key, entry, response.status_code, dict(response.headers),
+                                       response.content, response.encoding)
+
+    @staticmethod
+    async def _acquire(rate_limiter: Optional[HostRateLimiter], url: str):
+        if rate_limiter is not None:
+            await rate_limiter.acquire(httpx.URL(url).host)
+
+    def clear(self):
+        with self._lock:
+            for path in self.directory.glob("*"):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "enabled": self.enabled,
+            "size_bytes": self._size or 0,
+            "max_bytes": self.max_bytes
+        }
+
+    def _is_fresh(self, entry: Tuple[Dict[str, Any], bytes]) -> bool:
+        return time.time() - entry[0]["stored_at"] < self.ttl
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[Tuple[Dict[str, Any], bytes]]) -> Dict[str, str]:
+        if entry is None:
+            return {}
+        headers = entry[0]["headers"]
+        conditional = {}
+        if headers.get("etag"):
+            conditional["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
+
+    @staticmethod
+    def _to_response(entry: Tuple[Dict[str, Any], bytes]) -> CachedResponse:
+        meta, body = entry
+        return CachedResponse(meta["status_code"], meta["headers"], body, meta.get("encoding"), from_cache=True)
+
+    def _handle(self,
+                key: str,
+                entry: Optional[Tuple[Dict[str, Any], bytes]],
+                status_code: int,
+                headers: Dict[str, str],
+                content: bytes,
+                encoding: Optional[str]) -> CachedResponse:
+        """Turn a network response into the returned response, updating the cache"""
+        headers = {name.lower(): value for name, value in headers.items()}
+
+        if status_code == 304 and entry is not None:
+            # Unchanged: keep the body, restart the TTL
+            self.revalidated += 1
+            meta = {**entry[0], "stored_at": time.time()}
+            self._write(key, meta, entry[1])
+            return self._to_response((meta, entry[1]))
+
+        self.misses += 1
+        if status_code == 200 and "no-store" not in headers.get("cache-control", ""):
+            meta = {
+                "status_code": status_code,
+                "headers": {name: headers[name] for name in ("content-type", "etag", "last-modified")
+                            if name in headers},
+                "encoding": encoding,
+                "stored_at": time.time()
+            }
+            self._write(key, meta, content)
+
+        return CachedResponse(status_code, headers, content, encoding)
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def _lookup(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, meta: Dict[str, Any], body: bytes):
+        meta_path, body_path = self._paths(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                self._ensure_size()
+                self._size -= self._entry_size(key)
+
+                # Write to temp files and rename so readers never see partial entries
+                for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode("utf-8"))):
+                    tmp_path = path.with_suffix(path.suffix + f".{threading.get_ident()}.tmp")
+                    tmp_path.write_bytes(data)
+                    os.replace(tmp_path, path)
+
+                self._size += self._entry_size(key)
+                self._evict()
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry: {e}")
+
+    def _entry_size(self, key: str) -> int:
+        size = 0
+        for path in self._paths(key):
+            try:
+                size += path.stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def _ensure_size(self):
+        if self._size is None:
+            self._size = sum(path.stat().st_size for path in self.directory.glob("*")
+                             if not path.name.endswith(".tmp"))
+
+    def _evict(self):
+        """Remove the oldest entries until the cache fits its budget"""
+        if self._size <= self.max_bytes:
+            return
+
+        entries = sorted(self.directory.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        for meta_path in entries:
+            if self._size <= self.max_bytes:
+                break
+            key = meta_path.stem
+            self._size -= self._entry_size(key)
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+            self.evictions += 1
+
+_cache: Optional[HTTPCache] = None
+
+def get_http_cache() -> HTTPCache:
+    """Get the process-wide HTTP response cache"""
+    global _cache
+    if _cache is None:
+        _cache = HTTPCache(
+            os.getenv("HTTP_CACHE_DIR", "cache/http"),
+            ttl=float(os.getenv("HTTP_CACHE_TTL", "300")),
+            max_bytes=int(os.getenv("HTTP_CACHE_MAX_MB", "100")) * 1024 * 1024,
+            enabled=os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+        )
+    return _cache
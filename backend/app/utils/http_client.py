@@ -0,0 +1,33 @@
+"""
+Shared pooled HTTP client for outbound API calls
+"""
+import logging
+import os
+from typing import Optional
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide AsyncClient, reusing connections across requests"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(float(os.getenv("HTTP_TIMEOUT", "10"))),
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+            ),
+            follow_redirects=True
+        )
+    return _client
+
+async def close_http_client():
+    """Close the shared client on shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Closed HTTP client")
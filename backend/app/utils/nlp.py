@@ -0,0 +1,33 @@
+"""
+spaCy pipeline helpers
+Run only the pipeline components an extractor actually reads, and process
+many texts through nlp.pipe instead of one call per text
+"""
+import os
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+# Components needed for doc.noun_chunks (POS tags and dependency parse)
+NOUN_CHUNK_COMPONENTS = ("tok2vec", "tagger", "attribute_ruler", "parser")
+# Components needed for doc.ents
+ENTITY_COMPONENTS = ("tok2vec", "ner")
+
+def disabled_components(nlp, required: Sequence[str]) -> List[str]:
+    """Pipeline components that can be skipped when only `required` is read"""
+    return [name for name in nlp.pipe_names if name not in required]
+
+def process_text(nlp, text: str, required: Sequence[str]):
+    """Process a single text with only the required components"""
+    return nlp(text, disable=disabled_components(nlp, required))
+
+def pipe_texts(nlp,
+               texts: Iterable[str],
+               required: Sequence[str],
+               batch_size: Optional[int] = None,
+               n_process: Optional[int] = None) -> Iterator:
+    """Process many texts in batches with only the required components"""
+    return nlp.pipe(
+        texts,
+        batch_size=batch_size or int(os.getenv("SPACY_BATCH_SIZE", "64")),
+        n_process=n_process or int(os.getenv("SPACY_N_PROCESS", "1")),
+        disable=disabled_components(nlp, required)
+    )
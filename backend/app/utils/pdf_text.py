@@ -0,0 +1,132 @@
+"""
+PDF text extraction
+Pages are extracted lazily and yielded one at a time, so page and byte limits
+stop work early on oversized documents and the text is joined once at the end.
+Long PDFs can be split into page ranges extracted on a process pool.
+"""
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+try:
+    import pypdf as pdf_lib
+except ImportError:  # Older installs only have the PyPDF2 name
+    import PyPDF2 as pdf_lib
+
+logger = logging.getLogger(__name__)
+
+PDFSource = Union[str, Path, BinaryIO, bytes, memoryview]
+
+# Defaults keep a pathological upload from dominating a worker; 0 disables a limit
+MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "50"))
+MAX_TEXT_BYTES = int(os.getenv("PDF_MAX_TEXT_BYTES", str(512 * 1024)))
+# Documents with at least this many pages are split across processes (0 = never)
+PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "0"))
+PARALLEL_WORKERS = int(os.getenv("PDF_PARALLEL_WORKERS", "4"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+# Set in pool worker processes, which extract their pages serially
+_in_pool_worker = False
+
+def mark_pool_worker():
+    """Process pool initializer: keep PDFs in this process from fanning out to another pool"""
+    global _in_pool_worker
+    _in_pool_worker = True
+
+def _reader(source: PDFSource):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    elif not isinstance(source, (str, Path)):
+        source.seek(0)
+    return pdf_lib.PdfReader(source)
+
+def _extract_range(content: bytes, page_range: Tuple[int, int]) -> List[str]:
+    """Worker: text of pages [start, stop) from its own reader over the document bytes"""
+    reader = _reader(content)
+    return [(reader.pages[number].extract_text() or "") for number in range(*page_range)]
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=PARALLEL_WORKERS, initializer=mark_pool_worker)
+    return _executor
+
+def _read_bytes(source: PDFSource) -> bytes:
+    if isinstance(source, (str, Path)):
+        return Path(source).read_bytes()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    source.seek(0)
+    return source.read()
+
+def iter_page_texts(source: PDFSource, max_pages: Optional[int] = None,
+                    parallel_min_pages: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of each page in order.
+
+    Args:
+        source: File path, open binary file or the PDF bytes
+        max_pages: Stop after this many pages (default PDF_MAX_PAGES, 0 = all)
+        parallel_min_pages: Split documents with at least this many pages across
+            processes (default PDF_PARALLEL_MIN_PAGES, 0 = never)
+    """
+    max_pages = MAX_PAGES if max_pages is None else max_pages
+    parallel_min_pages = PARALLEL_MIN_PAGES if parallel_min_pages is None else parallel_min_pages
+
+    reader = _reader(source)
+    page_count = len(reader.pages)
+    if max_pages and page_count > max_pages:
+        logger.info(f"PDF has {page_count} pages, extracting the first {max_pages}")
+        page_count = max_pages
+
+    # Pool workers do not fan out again; server worker processes (uvicorn --workers) still do
+    if (parallel_min_pages and page_count >= parallel_min_pages and PARALLEL_WORKERS > 1
+            and not _in_pool_worker):
+        content = _read_bytes(source)
+        step = -(-page_count // PARALLEL_WORKERS)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        # map() yields ranges in page order as they complete
+        for texts in _get_executor().map(_extract_range, [content] * len(ranges), ranges):
+            yield from texts
+        return
+
+    for number in range(page_count):
+        yield reader.pages[number].extract_text() or ""
+
+def extract_pdf_text(source: PDFSource, max_pages: Optional[int] = None,
+                     max_bytes: Optional[int] = None) -> str:
+    """
+    Extract a PDF's text, one line break after each page.
+
+    Args:
+        source: File path, open binary file or the PDF bytes
+        max_pages: Page limit (default PDF_MAX_PAGES, 0 = all)
+        max_bytes: UTF-8 size limit of the text (default PDF_MAX_TEXT_BYTES, 0 = none)
+    """
+    max_bytes = MAX_TEXT_BYTES if max_bytes is None else max_bytes
+
+    parts: List[str] = []
+    size = 0
+    pages = iter_page_texts(source, max_pages)
+    for text in pages:
+        part = text + "\n"
+        part_size = len(part.encode("utf-8"))
+        if max_bytes and size + part_size > max_bytes:
+            # Keep what fits of this page; later pages are never extracted
+            remaining = max_bytes - size
+            parts.append(part.encode("utf-8")[:remaining].decode("utf-8", errors="ignore"))
+            logger.info(f"PDF text truncated at {max_bytes} bytes")
+            pages.close()
+            break
+        parts.append(part)
+        size += part_size
+    return "".join(parts)
+
+def shutdown_pdf_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
@@ -0,0 +1,39 @@
+"""
+Per-host request rate limiting for outbound HTTP calls
+"""
+import asyncio
+import os
+from typing import Dict, Optional
+
+class HostRateLimiter:
+    def __init__(self, requests_per_second: float = 5.0):
+        """
+        Args:
+            requests_per_second: Requests allowed per host per second (0 disables limiting)
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        # host -> earliest loop time the next request may start
+        self._next_slot: Dict[str, float] = {}
+
+    async def acquire(self, host: str):
+        """Wait until a request to host may be sent"""
+        if not self.interval:
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Reserve a slot before sleeping so concurrent callers queue up behind it
+        slot = max(now, self._next_slot.get(host, 0.0))
+        self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+_limiter: Optional[HostRateLimiter] = None
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Get the process-wide job API rate limiter, shared by every scraper instance"""
+    global _limiter
+    if _limiter is None:
+        _limiter = HostRateLimiter(float(os.getenv("JOB_API_RATE_LIMIT", "5")))
+    return _limiter
@@ -0,0 +1,78 @@
+"""
+Repository decode benchmark
+Compares per-document decode cost of Model(**doc), which the repositories
+use, and of a compiled TypeAdapter over the whole page on stored job and
+resume documents built from the mock generators
+"""
+import argparse
+import copy
+import gc
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from pydantic import TypeAdapter
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.models.job import JobListing
+from app.models.resume import Resume
+from app.repositories.job_repository import with_search_fields
+from app.services.job_service import JobService
+
+def job_documents(size: int) -> List[dict]:
+    """Jobs as JobRepository stores them"""
+    jobs = [JobListing(**job) for job in JobService()._generate_mock_data(count=size)]
+    return [with_search_fields(job.model_dump()) for job in jobs]
+
+def resume_documents(size: int) -> List[dict]:
+    resume = Resume(
+        name="Jane Doe",
+        contact={"email": "jane@example.com", "phone": "555-0100"},
+        summary="Backend engineer",
+        skills=[{"name": skill, "category": "technical"} for skill in
+                ("Python", "FastAPI", "MongoDB", "Docker", "AWS", "React", "SQL", "Git")],
+        experience=[{"company": f"Company {i}", "title": "Engineer", "description": "Built services"}
+                    for i in range(4)],
+        education=[{"institution": "State University", "degree": "BSc", "field_of_study": "CS"}]
+    )
+    return [{**resume.model_dump(), "id": f"resume-{i}"} for i in range(size)]
+
+def measure(label: str, decode_batch, docs: List[dict], repeat: int, baseline: float = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        batch = copy.deepcopy(docs)
+        # Collector pauses depend on the rest of the heap; leave them out of the comparison
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        decode_batch(batch)
+        best = min(best, time.perf_counter() - start)
+        gc.enable()
+
+    per_doc = best / len(docs) * 1e6
+    speedup = f"  ({baseline / per_doc:.2f}x)" if baseline else ""
+    print(f"  {label:<30} {per_doc:>8.2f} us/doc{speedup}")
+    return per_doc
+
+def run(name: str, model, docs: List[dict], repeat: int):
+    print(f"\n{name} ({len(docs)} documents)")
+    adapter = TypeAdapter(List[model])
+
+    baseline = measure("Model(**doc)", lambda batch: [model(**doc) for doc in batch], docs, repeat)
+    measure("TypeAdapter(List[Model])", adapter.validate_python, docs, repeat, baseline)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark repository document decoding")
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run("jobs", JobListing, job_documents(args.jobs), args.repeat)
+    run("resumes", Resume, resume_documents(args.resumes), args.repeat)
+
+if __name__ == "__main__":
+    main()
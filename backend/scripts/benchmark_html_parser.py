@@ -0,0 +1,90 @@
+"""
+HTML parsing benchmark for job scraping
+Compares the original BeautifulSoup(html.parser) + find_all card walk with
+each installed parser backend, on saved Indeed and RemoteOK result pages
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.job_scraper import INDEED_LAYOUT, REMOTEOK_LAYOUT
+from app.utils.html_parser import BACKENDS, CardExtractor, create_backend
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+def baseline_indeed(html: str):
+    """Card walk as JobScraper did it before the parser layer"""
+    cards = []
+    for card in BeautifulSoup(html, 'html.parser').find_all('div', class_='job_seen_beacon'):
+        title_elem = card.find('h2', class_='jobTitle')
+        company_elem = card.find('span', class_='companyName')
+        location_elem = card.find('div', class_='companyLocation')
+        if not all([title_elem, company_elem, location_elem]):
+            continue
+        cards.append((title_elem.text.strip(), company_elem.text.strip(), title_elem.find('a')['href']))
+    return cards
+
+def baseline_remoteok(html: str):
+    cards = []
+    for listing in BeautifulSoup(html, 'html.parser').find_all('tr', class_='job'):
+        title_elem = listing.find('h2', itemprop='title')
+        company_elem = listing.find('h3', itemprop='name')
+        description_elem = listing.find('td', class_='description')
+        if not all([title_elem, company_elem, description_elem]):
+            continue
+        cards.append((title_elem.text.strip(), company_elem.text.strip(),
+                      listing.find('a', class_='preventLink')['href']))
+    return cards
+
+def extracted(extractor: CardExtractor, html: str, required):
+    return [(card['title'], card['company'], card['url'])
+            for card in extractor.extract(html)
+            if all(card[field] is not None for field in required)]
+
+def measure(label: str, parse, html: str, iterations: int):
+    parse(html)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = parse(html)
+    elapsed = (time.perf_counter() - start) / iterations
+    print(f"  {label:<28} {elapsed * 1000:>8.2f} ms/page  ({len(result)} cards)")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on job board fixtures")
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    pages = [
+        ("indeed", FIXTURES / "indeed_cards.html", INDEED_LAYOUT, baseline_indeed,
+         ("title", "company", "location", "url")),
+        ("remoteok", FIXTURES / "remoteok_cards.html", REMOTEOK_LAYOUT, baseline_remoteok,
+         ("title", "company", "description", "url"))
+    ]
+
+    backends = []
+    for name in BACKENDS:
+        try:
+            backends.append(create_backend(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    for source, path, layout, baseline, required in pages:
+        html = path.read_text(encoding="utf-8")
+        print(f"\n{source} ({len(html) / 1024:.0f} KB)")
+        expected = measure("before: html.parser+find_all", baseline, html, args.iterations)
+
+        for backend in backends:
+            extractor = CardExtractor(layout, backend)
+            result = measure(backend.name, lambda page: extracted(extractor, page, required), html, args.iterations)
+            if result != expected:
+                print(f"  WARNING: {backend.name} output differs from the baseline")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Vector index benchmark
+Measures recall and latency of the IVF job index against exact search on a
+synthetic job corpus built from the mock job generator
+"""
+import argparse
+import hashlib
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.models.job import JobListing
+from app.services.embedding_store import JobEmbeddingStore
+from app.services.job_service import JobService
+from app.services.vector_index import IVFIndex
+
+def build_corpus(size: int):
+    """Generate mock jobs and the texts that get embedded for them"""
+    jobs = [JobListing(**job) for job in JobService()._generate_mock_data(count=size)]
+    return [job.id for job in jobs], [JobEmbeddingStore.job_text(job) for job in jobs]
+
+def hashing_encode(texts, dim: int = 384) -> np.ndarray:
+    """Cheap deterministic bag-of-words embedding so the benchmark runs without a model"""
+    vectors = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for token in re.findall(r"[a-z0-9+#.]+", text.lower()):
+            digest = hashlib.md5(token.encode("utf-8")).digest()
+            bucket = int.from_bytes(digest[:4], "little") % dim
+            vectors[row, bucket] += 1.0 if digest[4] & 1 else -1.0
+    return vectors
+
+def model_encode(texts) -> np.ndarray:
+    """Encode texts with the sentence transformer used for matching"""
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer('all-MiniLM-L6-v2')
+    return model.encode(texts, batch_size=256, show_progress_bar=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the job vector index")
+    parser.add_argument("--size", type=int, default=100_000, help="Number of synthetic jobs")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, default=100, help="Candidates retrieved per query")
+    parser.add_argument("--n-probe", type=int, nargs="+", default=[4, 8, 16, 32], help="Lists scanned per query")
+    parser.add_argument("--encoder", choices=["hashing", "model"], default="hashing",
+                        help="Embedding function (model uses all-MiniLM-L6-v2)")
+    args = parser.parse_args()
+
+    print(f"Generating {args.size} mock jobs...")
+    job_ids, texts = build_corpus(args.size)
+
+    encode = model_encode if args.encoder == "model" else hashing_encode
+    start = time.perf_counter()
+    vectors = encode(texts)
+    print(f"Encoded corpus in {time.perf_counter() - start:.1f}s ({args.encoder})")
+
+    # Queries are fresh mock jobs, standing in for resumes
+    _, query_texts = build_corpus(args.queries)
+    queries = encode(query_texts)
+
+    index = IVFIndex()
+    start = time.perf_counter()
+    index.add(job_ids, vectors)
+    print(f"Built index in {time.perf_counter() - start:.2f}s ({len(index._lists)} lists)")
+
+    start = time.perf_counter()
+    exact = [{job_id for job_id, _ in index.exact_search(query, k=args.k)} for query in queries]
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    print(f"\n{'n_probe':>8} {'recall@' + str(args.k):>12} {'ms/query':>10} {'speedup':>8}")
+    print(f"{'exact':>8} {1.0:>12.3f} {exact_ms:>10.2f} {1.0:>8.1f}")
+
+    for n_probe in args.n_probe:
+        start = time.perf_counter()
+        approximate = [{job_id for job_id, _ in index.search(query, k=args.k, n_probe=n_probe)} for query in queries]
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        recall = np.mean([len(a & e) / len(e) for a, e in zip(approximate, exact)])
+        print(f"{n_probe:>8} {recall:>12.3f} {elapsed_ms:>10.2f} {exact_ms / elapsed_ms:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Job search query plan check
+Runs explain() for representative JobRepository searches against the
+configured database and fails if an index-backed search mode is not driven
+by a search index (*_lc, the combined filter index or the text index). An
+index scan of posted_date alone only walks the sort order and does not count.
+"""
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import connect_to_mongo, close_mongo_connection, get_database
+from app.repositories.job_repository import JobRepository
+
+CASES = [
+    ("prefix", dict(title="Software")),
+    ("prefix", dict(company="tech")),
+    ("prefix", dict(location="San Francisco")),
+    ("prefix", dict(title="data", company="data", remote=True)),
+    ("text", dict(title="python developer")),
+    ("text", dict(title="engineer", location="remote")),
+    # Reference only: the unanchored case-insensitive regex is expected to scan the collection
+    ("regex", dict(title="engineer")),
+]
+
+def plan_stages(plan: Dict[str, Any]) -> List[Tuple[str, Optional[str]]]:
+    """All (stage name, index name) pairs in a (possibly nested) query plan"""
+    stages = [(plan.get("stage", ""), plan.get("indexName"))]
+    for child in plan.get("inputStages", []) + [plan[key] for key in ("inputStage", "queryPlan") if key in plan]:
+        stages.extend(plan_stages(child))
+    return stages
+
+def is_search_index(index_name: Optional[str]) -> bool:
+    """Indexes created for search: *_lc fields (alone or combined) and the text index"""
+    return bool(index_name) and ("_lc_" in index_name or index_name.endswith("_text"))
+
+async def main() -> int:
+    await connect_to_mongo()
+    db = get_database()
+    repository = JobRepository()
+    failures = 0
+
+    try:
+        for mode, filters in CASES:
+            query = repository.search_query(mode=mode, **filters)
+            explain = await db.jobs.find(query).sort("posted_date", -1).explain()
+            stages = plan_stages(explain["queryPlanner"]["winningPlan"])
+
+            uses_index = (any(stage == "IXSCAN" and is_search_index(index) for stage, index in stages)
+                          and all(stage != "COLLSCAN" for stage, _ in stages))
+            ok = uses_index or mode == "regex"
+            failures += not ok
+            plan = " > ".join(f"{stage}({index})" if index else stage for stage, index in stages)
+            print(f"{'OK  ' if ok else 'FAIL'} {mode:<6} {filters} -> {plan}")
+    finally:
+        await close_mongo_connection()
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -12,6 +12,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.database import connect_to_mongo, close_mongo_connection, get_database
 from app.services.job_service import JobService
+from app.repositories.job_repository import JobRepository, SEARCH_FIELDS
+from app.services.embedding_store import get_job_embedding_store
 from app.models.job import JobListing
 import logging
 
@@ -39,14 +41,34 @@ async def init_database():
             jobs = await job_service.get_job_listings(limit=50)
             
             if jobs:
-                # Insert jobs into database
-                job_dicts = [job.model_dump() for job in jobs]
-                result = await db.jobs.insert_many(job_dicts)
-                logger.info(f"✓ Inserted {len(result.inserted_ids)} jobs into database")
+                # Insert jobs into database (also stores their embeddings)
+                inserted = await JobRepository().create_many(jobs)
+                logger.info(f"✓ Inserted {inserted} jobs into database")
             else:
                 logger.warning("No jobs to insert")
         else:
             logger.info("✓ Database already has jobs")
+            
+            # Make sure every job has an up-to-date embedding in the vector index
+            logger.info("Backfilling job embeddings...")
+            job_repository = JobRepository()
+            embedding_store = get_job_embedding_store()
+            computed = 0
+            for skip in range(0, jobs_count, 500):
+                jobs = await job_repository.list_all(skip=skip, limit=500)
+                computed += await embedding_store.upsert_jobs(jobs)
+            logger.info(f"✓ Computed {computed} job embeddings")
+            
+            # Jobs stored before prefix search have no normalized search fields
+            logger.info("Backfilling search fields...")
+            result = await db.jobs.update_many(
+                {"$or": [{f"{field}_lc": {"$exists": False}} for field in SEARCH_FIELDS]},
+                [{"$set": {
+                    f"{field}_lc": {"$toLower": {"$trim": {"input": {"$ifNull": [f"${field}", ""]}}}}
+                    for field in SEARCH_FIELDS
+                }}]
+            )
+            logger.info(f"✓ Backfilled search fields on {result.modified_count} jobs")
         
         # Verify indexes
         logger.info("Verifying database indexes...")